@@ -33,6 +33,8 @@ class TranslationManager:
         self._translations: Dict[str, Dict[str, Any]] = {}  # 翻译缓存
         self._locale_dir = Path(__file__).parent / 'locales'  # 翻译文件目录
         self._observers: List[Callable] = []  # 语言切换观察者列表
+        self._widgets: Dict[int, Any] = {}  # 可翻译控件 {id: 控件}，Qt对象销毁时移除
+        self._lookup_cache: Dict[tuple, str] = {}  # 已解析的翻译 {(语言, 键): 文本}
         
         # 加载默认语言
         self.load_locale(self._current_locale)
@@ -77,6 +79,7 @@ class TranslationManager:
         
         if translations:
             self._translations[locale] = translations
+            self._lookup_cache.clear()
             return True
         
         return False
@@ -140,6 +143,10 @@ class TranslationManager:
         """
         if locale is None:
             locale = self._current_locale
+
+        translation = self._lookup_cache.get((locale, key))
+        if translation is not None:
+            return self._format_translation(translation, params) if params else translation
         
         # 解析键
         parts = key.replace(':', '.').split('.')
@@ -167,6 +174,7 @@ class TranslationManager:
         # 仍然找不到，返回缺失标记
         if translation is None:
             return f"[Missing: {key}]"
+        self._lookup_cache[(locale, key)] = translation
         
         # 参数化替换
         if params:
@@ -263,10 +271,42 @@ class TranslationManager:
         if callback in self._observers:
             self._observers.remove(callback)
     
+    def add_widget(self, widget):
+        """
+        注册可翻译控件
+
+        控件以强引用保存（与观察者一致，避免Python包装对象先于Qt对象被回收），
+        在Qt对象的destroyed信号中移除；语言切换时统一遍历一次更新文本
+
+        Args:
+            widget: 实现了_on_language_changed的可翻译控件
+        """
+        key = id(widget)
+        if key in self._widgets:
+            return
+        self._widgets[key] = widget
+        destroyed = getattr(widget, 'destroyed', None)
+        if destroyed is not None:
+            # destroyed会传入被销毁的对象，这里忽略参数只按键移除
+            destroyed.connect(lambda *_, key=key: self._widgets.pop(key, None))
+
     def _notify_observers(self):
         """通知所有观察者语言已切换"""
         print(f"\n🔔 通知观察者：语言已切换到 {self._current_locale}")
-        print(f"📌 观察者数量: {len(self._observers)}")
+
+        # 先一次性更新所有可翻译控件
+        updated = 0
+        for key, widget in list(self._widgets.items()):
+            try:
+                widget._on_language_changed(self._current_locale)
+                updated += 1
+            except RuntimeError:
+                # 底层Qt对象已销毁
+                self._widgets.pop(key, None)
+            except Exception as e:
+                # 单个控件更新失败不影响其余控件和观察者
+                print(f"  ❌ 可翻译控件更新失败: {e}")
+        print(f"📌 已更新可翻译控件: {updated}，观察者数量: {len(self._observers)}")
 
         for i, callback in enumerate(self._observers):
             try:
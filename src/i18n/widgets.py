@@ -31,8 +31,8 @@ class TranslatableWidget:
         self._translation_key = None
         self._translation_params = {}
         
-        # 注册到翻译管理器
-        TranslationManager.instance().add_observer(self._on_language_changed)
+        # 注册到翻译管理器（Qt对象销毁前一直保留，语言切换时统一更新）
+        TranslationManager.instance().add_widget(self)
     
     def set_translation(self, key: str, **params):
         """
@@ -64,16 +64,7 @@ class TranslatableWidget:
         Args:
             locale: 新的语言代码
         """
-        if self._translation_key:
-            print(f"    🔄 更新Widget翻译: {self._translation_key} → {locale}")
         self.update_translation()
-    
-    def __del__(self):
-        """析构函数，移除观察者"""
-        try:
-            TranslationManager.instance().remove_observer(self._on_language_changed)
-        except:
-            pass
 
 
 class TLabel(QLabel, TranslatableWidget):
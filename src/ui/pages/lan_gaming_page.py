@@ -3,12 +3,15 @@
 提供局域网联机配置和启动功能
 """
 import os
+import re
 import sys
 import subprocess
 import zipfile
 import configparser
 import time
 import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
@@ -20,6 +23,80 @@ from .base_page import BasePage
 from ...i18n.manager import TranslationManager, t
 
 
+# 启动状态标签可能显示的已知状态文本（中英文），语言切换时只对这些文本重新翻译
+_KNOWN_STATUS_TEXTS = frozenset({
+    '准备就绪', 'Ready',
+    '🌐 当前处于局域网联机模式', '🌐 Currently in LAN mode',
+    '配置保存成功', 'Config saved',
+    '配置保存失败', 'Failed to save config',
+    '已打开存档文件夹，请查看文件夹名称获取Steam ID', 'Save folder opened, check folder name for Steam ID',
+    '未找到存档文件夹，请确保游戏已运行过', 'Save folder not found, ensure game has been run',
+    '正在启动局域网联机模式...', 'Launching LAN mode...',
+    '局域网联机模式启动中，程序将重新启动', 'LAN mode launching, program will restart',
+    '正在安全退出局域网联机模式...', 'Safely exiting LAN mode...',
+    '✅ 安全退出完成，正在重启Nmodm...', '✅ Safe exit complete, restarting Nmodm...',
+    '正在检查DLL状态...', 'Checking DLL status...',
+    '🌐 检测到steamclient DLL已加载', '🌐 Detected steamclient DLL loaded',
+    '✅ 未检测到steamclient DLL', '✅ No steamclient DLL detected',
+    '请输入Steam ID', 'Please enter Steam ID',
+    'Steam ID格式错误，应为76开头的17位数字', 'Invalid Steam ID format, should be 17 digits starting with 76',
+    '请输入玩家名称', 'Please enter player name',
+    '配置文件不存在，请先保存配置', 'Config file not exist, please save config first',
+    '请先保存配置', 'Please save config first',
+    'ESL工具未就绪，请等待初始化完成', 'ESL tool not ready, please wait for initialization',
+    'steamclient_loader.exe不存在', 'steamclient_loader.exe not exist',
+})
+
+# 安全退出步骤文本前缀
+_STEP_PREFIXES = ("步骤", "Step ")
+
+# 启动状态文本匹配表：(中文片段, 英文片段, 翻译键)，按顺序匹配，先命中者生效
+_STATUS_TABLE = (
+    ("准备就绪", "Ready", "lan_gaming_page.label.status_ready"),
+    ("当前处于局域网联机模式", "Currently in LAN mode", "lan_gaming_page.status.in_lan_mode"),
+    ("配置保存成功", "Config saved", "lan_gaming_page.status.config_saved"),
+    ("配置保存失败", "Failed to save config", "lan_gaming_page.status.config_save_failed"),
+    ("已打开存档文件夹", "Save folder opened", "lan_gaming_page.status.save_folder_opened"),
+    ("未找到存档文件夹", "Save folder not found", "lan_gaming_page.status.save_folder_not_found"),
+    ("正在启动局域网联机模式", "Launching LAN mode", "lan_gaming_page.status.launching"),
+    ("局域网联机模式启动中", "LAN mode launching", "lan_gaming_page.status.launch_success"),
+    ("正在安全退出", "Safely exiting", "lan_gaming_page.status.exiting_lan"),
+    ("步骤1/4", "Step 1/4", "lan_gaming_page.status.exit_step_1"),
+    ("步骤2/4", "Step 2/4", "lan_gaming_page.status.exit_step_2"),
+    ("步骤3/4", "Step 3/4", "lan_gaming_page.status.exit_step_3"),
+    ("步骤4/4", "Step 4/4", "lan_gaming_page.status.exit_step_4"),
+    ("安全退出完成", "Safe exit complete", "lan_gaming_page.status.exit_complete"),
+    ("正在检查DLL状态", "Checking DLL", "lan_gaming_page.status.checking_dll"),
+    ("检测到steamclient DLL已加载", "Detected steamclient DLL loaded", "lan_gaming_page.status.dll_loaded"),
+    ("未检测到steamclient DLL", "No steamclient DLL detected", "lan_gaming_page.status.dll_not_loaded"),
+    ("请输入Steam ID", "Please enter Steam ID", "lan_gaming_page.error.steamid_required"),
+    ("Steam ID格式错误", "Invalid Steam ID format", "lan_gaming_page.error.steamid_invalid"),
+    ("请输入玩家名称", "Please enter player name", "lan_gaming_page.error.name_required"),
+    ("配置文件不存在", "Config file not exist", "lan_gaming_page.error.config_not_exist"),
+    ("请先保存配置", "Please save config first", "lan_gaming_page.error.save_config_first"),
+    ("ESL工具未就绪", "ESL tool not ready", "lan_gaming_page.error.esl_not_ready"),
+    ("steamclient_loader.exe不存在", "steamclient_loader.exe not exist", "lan_gaming_page.error.steamclient_loader_not_exist"),
+)
+
+
+def _build_status_buckets():
+    """按片段首字符对匹配表分桶，桶内保持原有匹配顺序"""
+    buckets = defaultdict(list)
+    for entry in _STATUS_TABLE:
+        zh, en, _ = entry
+        buckets[zh[0]].append(entry)
+        if en[0] != zh[0]:
+            buckets[en[0]].append(entry)
+    return dict(buckets)
+
+
+# 所有片段都是对应状态文本（去掉图标前缀后）的开头，只需探测与文本首字符相同的桶
+_STATUS_BY_FIRSTCHAR = _build_status_buckets()
+
+# 状态文本前的图标及空白（如 "🌐 "、"✅ "）
+_LEADING_SYMBOLS_RE = re.compile(r'^\W+')
+
+
 class ESLExtractWorker(QThread):
     """ESL解压工作线程"""
     progress_updated = Signal(int)  # 进度更新
@@ -85,6 +162,15 @@ class LanGamingPage(BasePage):
         # ESL解压工作线程
         self.extract_worker = None
 
+        # 语言切换状态：记录上次应用的语言，说明文本在隐藏时延迟到显示时再刷新
+        self._last_locale = TranslationManager.instance().get_current_locale()
+        self._help_text_stale = False
+
+        # 使用说明组件（在 setup_help_section_compact 中创建）
+        self.help_group = None
+        self.help_left_text = None
+        self.help_right_text = None
+
         self.setup_content()
 
         # 注册语言切换观察者
@@ -1625,8 +1711,65 @@ ip_country=CN
             }}
         """)
 
+    def showEvent(self, event):
+        """页面显示事件 - 补做隐藏期间跳过的说明文本刷新"""
+        super().showEvent(event)
+        if self._help_text_stale:
+            self.refresh_help_texts()
+
+    def refresh_help_texts(self):
+        """按当前语言重新生成使用说明文本"""
+        self._help_text_stale = False
+
+        # 两个文本框更新期间暂停重绘，完成后统一排版一次
+        if self.help_group is not None:
+            self.help_group.setUpdatesEnabled(False)
+        try:
+            self._set_help_texts()
+        finally:
+            if self.help_group is not None:
+                self.help_group.setUpdatesEnabled(True)
+
+    def _set_help_texts(self):
+        """生成并写入左右两侧说明文本"""
+        if self.help_left_text is not None:
+            left_content = f"""{t("lan_gaming_page.help.steamid_title")}
+
+{t("lan_gaming_page.help.steamid_method_1")}
+{t("lan_gaming_page.help.steamid_method_1_example")}
+{t("lan_gaming_page.help.steamid_method_1_note")}
+
+{t("lan_gaming_page.help.steamid_method_2")}
+{t("lan_gaming_page.help.steamid_method_2_example")}
+{t("lan_gaming_page.help.steamid_method_2_note")}
+
+{t("lan_gaming_page.help.steamid_method_3")}"""
+            self.help_left_text.setPlainText(left_content)
+
+        if self.help_right_text is not None:
+            right_content = f"""{t("lan_gaming_page.help.usage_title")}
+
+{t("lan_gaming_page.help.usage_step_1")}
+{t("lan_gaming_page.help.usage_step_2")}
+{t("lan_gaming_page.help.usage_step_3")}
+{t("lan_gaming_page.help.usage_step_4")}
+{t("lan_gaming_page.help.usage_step_5")}
+
+{t("lan_gaming_page.help.notes_title")}
+{t("lan_gaming_page.help.notes_1")}
+{t("lan_gaming_page.help.notes_2")}
+{t("lan_gaming_page.help.notes_3")}"""
+            self.help_right_text.setPlainText(right_content)
+
     def _on_language_changed(self, language_code):
         """语言切换回调"""
+        # 语言未变化时无需重新翻译
+        if language_code == self._last_locale:
+            return
+        self._last_locale = language_code
+
+        # 批量更新期间暂停整页重绘，结束后只重绘一次
+        self.setUpdatesEnabled(False)
         try:
             # 更新页面标题
             if hasattr(self, 'title_label'):
@@ -1637,7 +1780,7 @@ ip_country=CN
                 self.esl_status_group.setTitle(t("lan_gaming_page.section.esl_status"))
             if hasattr(self, 'config_group'):
                 self.config_group.setTitle(t("lan_gaming_page.section.lan_config"))
-            if hasattr(self, 'help_group'):
+            if self.help_group is not None:
                 self.help_group.setTitle(t("lan_gaming_page.section.help"))
 
             # 更新启动区域标题（根据当前模式）
@@ -1699,89 +1842,25 @@ ip_country=CN
             if hasattr(self, 'status_label'):
                 current_text = self.status_label.text()
 
-                # 判断当前状态并重新生成文本
-                if "准备就绪" in current_text or "Ready" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.label.status_ready"))
-                elif "当前处于局域网联机模式" in current_text or "Currently in LAN mode" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.in_lan_mode"))
-                elif "配置保存成功" in current_text or "Config saved" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.config_saved"))
-                elif "配置保存失败" in current_text or "Failed to save config" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.config_save_failed"))
-                elif "已打开存档文件夹" in current_text or "Save folder opened" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.save_folder_opened"))
-                elif "未找到存档文件夹" in current_text or "Save folder not found" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.save_folder_not_found"))
-                elif "正在启动局域网联机模式" in current_text or "Launching LAN mode" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.launching"))
-                elif "局域网联机模式启动中" in current_text or "LAN mode launching" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.launch_success"))
-                elif "正在安全退出" in current_text or "Safely exiting" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.exiting_lan"))
-                elif "步骤1/4" in current_text or "Step 1/4" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.exit_step_1"))
-                elif "步骤2/4" in current_text or "Step 2/4" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.exit_step_2"))
-                elif "步骤3/4" in current_text or "Step 3/4" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.exit_step_3"))
-                elif "步骤4/4" in current_text or "Step 4/4" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.exit_step_4"))
-                elif "安全退出完成" in current_text or "Safe exit complete" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.exit_complete"))
-                elif "正在检查DLL状态" in current_text or "Checking DLL" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.checking_dll"))
-                elif "检测到steamclient DLL已加载" in current_text or "Detected steamclient DLL loaded" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.dll_loaded"))
-                elif "未检测到steamclient DLL" in current_text or "No steamclient DLL detected" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.status.dll_not_loaded"))
-                # 错误消息
-                elif "请输入Steam ID" in current_text or "Please enter Steam ID" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.error.steamid_required"))
-                elif "Steam ID格式错误" in current_text or "Invalid Steam ID format" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.error.steamid_invalid"))
-                elif "请输入玩家名称" in current_text or "Please enter player name" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.error.name_required"))
-                elif "配置文件不存在" in current_text or "Config file not exist" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.error.config_not_exist"))
-                elif "请先保存配置" in current_text or "Please save config first" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.error.save_config_first"))
-                elif "ESL工具未就绪" in current_text or "ESL tool not ready" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.error.esl_not_ready"))
-                elif "steamclient_loader.exe不存在" in current_text or "steamclient_loader.exe not exist" in current_text:
-                    self.status_label.setText(t("lan_gaming_page.error.steamclient_loader_not_exist"))
-
-            # 更新使用说明文本
-            if hasattr(self, 'help_left_text'):
-                left_content = f"""{t("lan_gaming_page.help.steamid_title")}
-
-{t("lan_gaming_page.help.steamid_method_1")}
-{t("lan_gaming_page.help.steamid_method_1_example")}
-{t("lan_gaming_page.help.steamid_method_1_note")}
-
-{t("lan_gaming_page.help.steamid_method_2")}
-{t("lan_gaming_page.help.steamid_method_2_example")}
-{t("lan_gaming_page.help.steamid_method_2_note")}
-
-{t("lan_gaming_page.help.steamid_method_3")}"""
-                self.help_left_text.setPlainText(left_content)
-
-            if hasattr(self, 'help_right_text'):
-                right_content = f"""{t("lan_gaming_page.help.usage_title")}
-
-{t("lan_gaming_page.help.usage_step_1")}
-{t("lan_gaming_page.help.usage_step_2")}
-{t("lan_gaming_page.help.usage_step_3")}
-{t("lan_gaming_page.help.usage_step_4")}
-{t("lan_gaming_page.help.usage_step_5")}
-
-{t("lan_gaming_page.help.notes_title")}
-{t("lan_gaming_page.help.notes_1")}
-{t("lan_gaming_page.help.notes_2")}
-{t("lan_gaming_page.help.notes_3")}"""
-                self.help_right_text.setPlainText(right_content)
+                # 判断当前状态并重新生成文本（非已知状态文本，如带错误详情的消息，保持原样）
+                if (current_text in _KNOWN_STATUS_TEXTS
+                        or current_text.startswith(_STEP_PREFIXES)):
+                    stripped = _LEADING_SYMBOLS_RE.sub('', current_text)
+                    for zh, en, key in _STATUS_BY_FIRSTCHAR.get(stripped[:1], ()):
+                        if zh in current_text or en in current_text:
+                            self.status_label.setText(t(key))
+                            break
+
+            # 更新使用说明文本（隐藏时 setPlainText 仍会触发重新排版，延迟到显示时再刷新）
+            if self.help_group is not None and not self.help_group.isVisible():
+                self._help_text_stale = True
+            else:
+                self.refresh_help_texts()
 
         except Exception as e:
             print(f"语言切换回调失败: {e}")
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class LanGamingInitWorker(QThread):
@@ -1798,13 +1877,16 @@ class LanGamingInitWorker(QThread):
     def run(self):
         """在后台线程中执行初始化"""
         try:
-            # 1. 初始化ESL工具
+            # ESL工具初始化与局域网模式检测互不依赖（均只访问文件系统/进程信息，
+            # 不触碰Qt控件），并发执行，总耗时取两者中较长者
             self.progress_updated.emit("🔧 正在初始化ESL工具...", "info")
-            esl_result = self.page.initialize_esl_sync()
-
-            # 2. 检测局域网模式
             self.progress_updated.emit("🌐 正在检测局域网模式...", "info")
-            lan_mode_result = self.page.check_and_update_lan_mode_sync()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                esl_future = executor.submit(self.page.initialize_esl_sync)
+                lan_mode_future = executor.submit(self.page.check_and_update_lan_mode_sync)
+
+                esl_result = esl_future.result()
+                lan_mode_result = lan_mode_future.result()
 
             # 发送完成信号
             self.initialization_complete.emit(esl_result, lan_mode_result)
@@ -2,89 +2,250 @@
 工具下载页面
 ME3工具和EasyTier下载管理
 """
+import os
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                QPushButton, QProgressBar, QFrame, QGroupBox,
-                               QTextEdit, QComboBox, QRadioButton)
-from PySide6.QtCore import Qt, Signal, QTimer, QThread
+                               QTextEdit, QComboBox, QRadioButton, QApplication)
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QRunnable, QThreadPool, QEvent
 from .base_page import BasePage
 from src.i18n import TLabel, t, TranslationManager
 
 
-class StatusCheckWorker(QThread):
-    """状态检查工作线程"""
-    status_checked = Signal(dict)  # 发送状态检查结果
+def _compile_keyword_pattern(keyword_map):
+    """将(翻译键, 关键字列表)编译为一个正则，匹配结果的lastgroup即翻译键"""
+    return re.compile('|'.join(
+        f"(?P<{key}>{'|'.join(re.escape(keyword) for keyword in keywords)})"
+        for key, keywords in keyword_map
+    ))
+
+
+# 语言切换时根据OnlineFix标签当前文本（中/英）识别其状态
+_ONLINEFIX_STATUS_RE = _compile_keyword_pattern((
+    ('status_check_failed', ('状态检查失败', 'Status check failed')),
+    ('start_failed', ('下载启动失败', 'Start failed')),
+    ('check_failed', ('检查失败', 'Check failed')),
+    ('checking', ('检查中', 'Checking')),
+    ('complete', ('工具包完整', 'Complete')),
+    ('missing', ('工具包缺失', 'Missing')),
+    ('download_complete', ('下载完成', 'Downloaded')),
+    ('download_failed', ('下载失败', 'Failed')),
+    ('downloading', ('正在下载', 'Downloading')),
+))
+_ONLINEFIX_DETAIL_RE = _compile_keyword_pattern((
+    ('error', ('错误', 'Error')),
+    ('includes', ('包含', 'Includes')),
+    ('ready', ('所有必需文件已就绪', 'All files ready')),
+    ('need_download', ('需要下载', 'Need to download')),
+    ('installed', ('已安装完成', 'installed')),
+))
+
+
+def _release_check_key(tool, include_prerelease=False):
+    """更新检查的去重键和版本号缓存键（EasyTier区分正式版/预发行版）"""
+    if tool == 'easytier' and include_prerelease:
+        return 'easytier_prerelease'
+    return tool
+
+
+def _set_text_if_changed(widget, text):
+    """文本未变化时跳过setText，避免重复刷新触发重新布局"""
+    if widget.text() != text:
+        widget.setText(text)
+
+
+class StatusCheckSignals(QObject):
+    """状态检查信号"""
+    status_checked = Signal(int, dict)  # 检查序号, 状态检查结果
+
+
+class StatusCheckRunnable(QRunnable):
+    """状态检查任务（在线程池中运行）"""
 
-    def __init__(self, download_manager):
+    def __init__(self, download_manager, signals, generation, include_easytier=True):
         super().__init__()
         self.download_manager = download_manager
+        self.signals = signals
+        self.generation = generation
+        self.include_easytier = include_easytier  # EasyTier区域未创建时跳过其版本探测
 
     def run(self):
-        """在后台线程中检查状态"""
+        """在线程池中检查状态"""
+        self.signals.status_checked.emit(
+            self.generation, collect_status_info(self.download_manager, self.include_easytier)
+        )
+
+
+def collect_status_info(download_manager, include_easytier=True):
+    """查询所有工具的本地状态，失败时返回空状态让UI显示默认状态"""
+    try:
+        status_info = {
+            'me3_installed': download_manager.is_me3_installed(),
+            'me3_full_installed': download_manager.is_me3_full_installed(),
+            'me3_install_type': download_manager.get_me3_install_type(),
+            'me3_version': download_manager.get_current_version(),
+            'me3_full_version': download_manager.get_me3_full_version(),
+            'installer_exists': (download_manager.me3_dir / "me3_installer.exe").exists()
+        }
+        if include_easytier:
+            status_info['easytier_version'] = download_manager.get_current_easytier_version()
+        return status_info
+    except Exception as e:
+        print(f"状态检查失败: {e}")
+        return {}
+
+
+class VCRedistSignals(QObject):
+    """运行库修复信号"""
+    status_update = Signal(str)
+    success = Signal()
+    error = Signal(int)  # 安装程序返回码
+    failed = Signal(str)  # 下载或安装过程出现异常(错误信息)
+
+
+class VCRedistRunnable(QRunnable):
+    """VC++运行库修复任务（在线程池中运行）"""
+
+    def __init__(self, download_manager, signals):
+        super().__init__()
+        self.download_manager = download_manager
+        self.signals = signals
+
+    def run(self):
+        """在线程池中下载并静默安装运行库"""
         try:
-            # 检查所有工具的状态（本地检查，速度快）
-            status_info = {
-                'me3_installed': self.download_manager.is_me3_installed(),
-                'me3_full_installed': self.download_manager.is_me3_full_installed(),
-                'me3_install_type': self.download_manager.get_me3_install_type(),
-                'me3_version': self.download_manager.get_current_version(),
-                'me3_full_version': self.download_manager.get_me3_full_version(),
-                'easytier_version': self.download_manager.get_current_easytier_version(),
-                'installer_exists': (self.download_manager.me3_dir / "me3_installer.exe").exists()
-            }
-            self.status_checked.emit(status_info)
+            # 创建tools目录
+            tools_dir = self.download_manager.me3_dir / "tools"
+            tools_dir.mkdir(exist_ok=True)
+
+            # VC++运行库下载URL
+            vcredist_url = "https://aka.ms/vs/17/release/vc_redist.x64.exe"
+            vcredist_path = tools_dir / "vc_redist.x64.exe"
+            log_path = tools_dir / "vcredist_install.log"
+
+            # 下载VC++运行库
+            self.signals.status_update.emit(t("me3_page.status.downloading_vcredist"))
+
+            # 使用分段下载（服务器支持Range时多连接并行），在当前线程池线程中同步执行
+            progress_prefix = t('me3_page.status.downloading_vcredist')
+            self.download_manager.download_file(
+                vcredist_url, vcredist_path,
+                progress_callback=lambda percent: self.signals.status_update.emit(f"{progress_prefix} {percent}%")
+            )
+
+            # 执行静默安装
+            self.signals.status_update.emit(t("me3_page.status.installing"))
+            install_cmd = [
+                str(vcredist_path),
+                "/install",
+                "/quiet",
+                "/norestart",
+                "/passive",
+                "/log",
+                str(log_path)
+            ]
+
+            creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+            result = subprocess.run(install_cmd, capture_output=True, text=True, creationflags=creation_flags)
+
+            # 发射结果信号
+            if result.returncode == 0:
+                self.signals.success.emit()
+            else:
+                self.signals.error.emit(result.returncode)
+
         except Exception as e:
-            print(f"状态检查失败: {e}")
-            # 发送空状态，让UI显示默认状态
-            self.status_checked.emit({})
+            self.signals.status_update.emit(f"运行库修复失败: {str(e)}")
+            self.signals.failed.emit(str(e))
+            print(f"VC++运行库修复失败: {e}")
+
+
+class ReleaseInfoSignals(QObject):
+    """发行版信息检查信号"""
+    fetched = Signal(str, dict)  # 工具名称, 检查结果
 
 
-class UpdateCheckWorker(QThread):
-    """更新检查工作线程"""
-    me3_update_checked = Signal(dict)
-    easytier_update_checked = Signal(dict)
+class ReleaseInfoRunnable(QRunnable):
+    """发行版信息检查任务（在线程池中运行，每个工具一个任务）"""
 
-    def __init__(self, download_manager, include_prerelease=False):
+    def __init__(self, tool, download_manager, signals, include_prerelease=False, use_cache=True):
         super().__init__()
+        self.tool = tool
         self.download_manager = download_manager
+        self.signals = signals
         self.include_prerelease = include_prerelease
+        self.use_cache = use_cache
 
     def run(self):
-        """在后台线程中检查更新"""
-        # 检查ME3更新
+        """在线程池中检查更新"""
+        if self.tool == 'me3':
+            result = self._check_me3()
+        else:
+            result = self._check_easytier()
+
+        # 记录版本号，有效期内再次进入页面无需联网
+        if result.get('success') and result.get('latest_version'):
+            key = _release_check_key(self.tool, self.include_prerelease)
+            self.download_manager.save_release_tag(key, result['latest_version'])
+        self.signals.fetched.emit(self.tool, result)
+
+        # 检查到新发行版后通常紧接着下载，提前测速下载源，点击下载时无需再等待
+        if result.get('release_info'):
+            self.download_manager.prefetch_download_source(result['release_info'])
+
+    def _check_me3(self):
+        """检查ME3更新"""
         try:
-            release_info = self.download_manager.get_latest_release_info()
+            release_info = self.download_manager.get_latest_release_info(use_cache=self.use_cache)
             if release_info:
-                latest_version = release_info.get('tag_name', '未知')
-                current_version = self.download_manager.get_current_version()
-                self.me3_update_checked.emit({
+                # 只做网络请求，本地版本由状态检查负责
+                return {
                     'success': True,
-                    'latest_version': latest_version,
-                    'current_version': current_version
-                })
-            else:
-                self.me3_update_checked.emit({'success': False, 'error': '无法获取版本信息'})
+                    'latest_version': release_info.get('tag_name', '未知'),
+                    'release_info': release_info  # 供下载时复用，避免重复请求
+                }
+            return {'success': False, 'error': '无法获取版本信息'}
         except Exception as e:
-            self.me3_update_checked.emit({'success': False, 'error': str(e)})
+            return {'success': False, 'error': str(e)}
 
-        # 检查EasyTier更新
+    def _check_easytier(self):
+        """检查EasyTier更新"""
         try:
-            has_update, latest_version, message = self.download_manager.check_easytier_update(self.include_prerelease)
-            current_version = self.download_manager.get_current_easytier_version()
-            self.easytier_update_checked.emit({
+            # 只做网络请求，本地版本由状态检查负责
+            return {
                 'success': True,
-                'has_update': has_update,
-                'latest_version': latest_version,
-                'current_version': current_version,
-                'message': message,
+                'latest_version': self.download_manager.get_latest_easytier_version(self.include_prerelease, self.use_cache),
                 'include_prerelease': self.include_prerelease
-            })
+            }
         except Exception as e:
-            self.easytier_update_checked.emit({'success': False, 'error': str(e)})
+            return {'success': False, 'error': str(e), 'include_prerelease': self.include_prerelease}
 
 
 class VersionInfoCard(QFrame):
     """版本信息卡片"""
 
+    # 预先生成的样式表，多个卡片共用
+    _QSS_CARD = """
+        VersionInfoCard {
+            border: 1px solid #313244;
+            border-radius: 8px;
+            padding: 12px;
+        }
+        QLabel#currentVersion, QLabel#latestVersion {
+            font-size: 14px;
+            font-weight: bold;
+            padding: 4px 0px;
+        }
+        QLabel#currentVersion { color: #cdd6f4; }
+        QLabel#latestVersion { color: #89b4fa; }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.latest_version = None  # 添加latest_version属性
@@ -93,13 +254,7 @@ class VersionInfoCard(QFrame):
     def setup_ui(self):
         """设置UI"""
         self.setFrameStyle(QFrame.Box)
-        self.setStyleSheet("""
-            VersionInfoCard {
-                border: 1px solid #313244;
-                border-radius: 8px;
-                padding: 12px;
-            }
-        """)
+        self.setStyleSheet(self._QSS_CARD)
 
         # 使用水平布局，紧凑排列
         main_layout = QHBoxLayout()
@@ -110,29 +265,17 @@ class VersionInfoCard(QFrame):
         left_layout = QVBoxLayout()
         left_layout.setSpacing(8)
 
+        self.update_prefixes()
+
         # 当前版本
-        self.current_version_label = QLabel(f"{t('me3_page.label.current_version')} {t('me3_page.status.not_installed')}")
+        self.current_version_label = QLabel(f"{self.current_prefix} {t('me3_page.status.not_installed')}")
         self.current_version_label.setFixedHeight(28)
-        self.current_version_label.setStyleSheet("""
-            QLabel {
-                color: #cdd6f4;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 4px 0px;
-            }
-        """)
+        self.current_version_label.setObjectName("currentVersion")
 
         # 最新版本
-        self.latest_version_label = QLabel(f"{t('me3_page.label.latest_version')} {t('me3_page.status.checking')}")
+        self.latest_version_label = QLabel(f"{self.latest_prefix} {t('me3_page.status.checking')}")
         self.latest_version_label.setFixedHeight(28)
-        self.latest_version_label.setStyleSheet("""
-            QLabel {
-                color: #89b4fa;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 4px 0px;
-            }
-        """)
+        self.latest_version_label.setObjectName("latestVersion")
 
         left_layout.addWidget(self.current_version_label)
         left_layout.addWidget(self.latest_version_label)
@@ -146,21 +289,26 @@ class VersionInfoCard(QFrame):
         main_layout.addLayout(right_layout, 1)  # 右侧占1份
 
         self.setLayout(main_layout)
+
+    def update_prefixes(self):
+        """按当前语言缓存标签前缀，update_info只需拼接字符串"""
+        self.current_prefix = t('me3_page.label.current_version')
+        self.latest_prefix = t('me3_page.label.latest_version')
     
     def update_info(self, current_version=None, latest_version=None, version_type=None, current_version_type=None):
         """更新版本信息"""
         if current_version is not None:
-            current_text = f"{t('me3_page.label.current_version')} {current_version or t('me3_page.status.not_installed')}"
+            current_text = f"{self.current_prefix} {current_version or t('me3_page.status.not_installed')}"
             if current_version and current_version_type:
                 current_text += f" ({current_version_type})"
-            self.current_version_label.setText(current_text)
+            _set_text_if_changed(self.current_version_label, current_text)
 
         if latest_version is not None:
             self.latest_version = latest_version  # 保存latest_version
-            latest_text = f"{t('me3_page.label.latest_version')} {latest_version or t('me3_page.error.get_failed')}"
+            latest_text = f"{self.latest_prefix} {latest_version or t('me3_page.error.get_failed')}"
             if version_type:
                 latest_text += f" ({version_type})"
-            self.latest_version_label.setText(latest_text)
+            _set_text_if_changed(self.latest_version_label, latest_text)
         
 
 
@@ -171,49 +319,200 @@ class ToolDownloadPage(BasePage):
     # 状态更新信号
     status_updated = Signal()
 
+    # 进度条刷新最小间隔（秒）
+    PROGRESS_UI_INTERVAL = 0.1
+
+    # 页面级样式表：控件通过objectName/动态属性匹配样式，整页只解析一次
+    _QSS_PAGE = """
+        QGroupBox#toolSection {
+            color: #cdd6f4;
+            font-size: 16px;
+            font-weight: bold;
+            border: 2px solid #313244;
+            border-radius: 8px;
+            margin-top: 10px;
+            padding-top: 15px;
+        }
+        QGroupBox#toolSection::title {
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 8px 0 8px;
+            color: #89b4fa;
+        }
+        QPushButton#successButton, QPushButton#primaryButton, QPushButton#infoButton,
+        QPushButton#warningButton, QPushButton#dangerButton {
+            border: none;
+            border-radius: 6px;
+            color: #1e1e2e;
+            font-size: 13px;
+            font-weight: bold;
+            padding: 8px 16px;
+        }
+        QPushButton#successButton { background-color: #a6e3a1; }
+        QPushButton#successButton:hover { background-color: #94d3a2; }
+        QPushButton#successButton:pressed { background-color: #82c3a3; }
+        QPushButton#primaryButton { background-color: #89b4fa; }
+        QPushButton#primaryButton:hover { background-color: #74c7ec; }
+        QPushButton#primaryButton:pressed { background-color: #64a8d8; }
+        QPushButton#infoButton { background-color: #74c7ec; }
+        QPushButton#infoButton:hover { background-color: #89dceb; }
+        QPushButton#infoButton:pressed { background-color: #5fb3d4; }
+        QPushButton#warningButton { background-color: #fab387; }
+        QPushButton#warningButton:hover { background-color: #f9c74f; }
+        QPushButton#warningButton:pressed { background-color: #f8b500; }
+        QPushButton#dangerButton { background-color: #f38ba8; }
+        QPushButton#dangerButton:hover { background-color: #eba0ac; }
+        QPushButton#dangerButton:pressed { background-color: #d67a8a; }
+        QPushButton#successButton:disabled, QPushButton#primaryButton:disabled, QPushButton#infoButton:disabled,
+        QPushButton#warningButton:disabled, QPushButton#dangerButton:disabled {
+            background-color: #45475a;
+            color: #6c7086;
+        }
+        QProgressBar#toolProgress {
+            border: 1px solid #313244;
+            border-radius: 4px;
+            background-color: #1e1e2e;
+            text-align: center;
+            color: #cdd6f4;
+            font-weight: bold;
+            height: 20px;
+        }
+        QProgressBar#toolProgress::chunk {
+            background-color: #a6e3a1;
+            border-radius: 3px;
+        }
+        QLabel#versionTypeLabel {
+            color: #cdd6f4;
+            font-size: 12px;
+            font-weight: bold;
+        }
+        QRadioButton#versionTypeRadio {
+            color: #cdd6f4;
+            font-size: 12px;
+            font-weight: bold;
+            spacing: 8px;
+        }
+        QRadioButton#versionTypeRadio::indicator {
+            width: 14px;
+            height: 14px;
+        }
+        QRadioButton#versionTypeRadio::indicator:unchecked {
+            border: 2px solid #6c7086;
+            border-radius: 7px;
+            background-color: transparent;
+        }
+        QRadioButton#versionTypeRadio::indicator:checked {
+            border: 2px solid #89b4fa;
+            border-radius: 7px;
+            background-color: #89b4fa;
+        }
+        QFrame#onlinefixCard, QFrame#onlinefixCard QLabel {
+            background-color: #1e1e2e;
+            border: 1px solid #313244;
+            border-radius: 8px;
+            padding: 8px;
+        }
+        QFrame#onlinefixCard QLabel#onlinefixTitle {
+            color: #89b4fa;
+            font-size: 13px;
+            font-weight: bold;
+            margin-bottom: 4px;
+        }
+        QFrame#onlinefixCard QLabel#onlinefixDetail {
+            color: #6c7086;
+            font-size: 11px;
+            margin-top: 4px;
+        }
+        QFrame#onlinefixCard QLabel#onlinefixStatus {
+            font-size: 12px;
+            padding: 4px 8px;
+            background-color: #313244;
+            border-radius: 4px;
+            color: #fab387;
+            border: 1px solid #fab387;
+        }
+        QFrame#onlinefixCard QLabel#onlinefixStatus[state="ok"] {
+            color: #a6e3a1;
+            border: 1px solid #a6e3a1;
+        }
+        QFrame#onlinefixCard QLabel#onlinefixStatus[state="error"] {
+            color: #f38ba8;
+            border: 1px solid #f38ba8;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(t("me3_page.page_title"), parent)
+        self.setStyleSheet(self.styleSheet() + self._QSS_PAGE)
         self.download_manager = None  # 延迟初始化
         self.me3_download_worker = None
         self.me3_installer_download_worker = None  # ME3安装程序下载工作线程
         self.easytier_download_worker = None
         self.onlinefix_download_worker = None  # OnlineFix下载工作线程
-        self.status_check_worker = None  # 状态检查工作线程
-        self.update_check_worker = None  # 更新检查工作线程
+        # 状态检查信号（线程池任务共用），序号用于丢弃过期结果
+        self._status_signals = StatusCheckSignals()
+        self._status_signals.status_checked.connect(self._on_status_result, Qt.QueuedConnection)
+        self._status_generation = 0
+        # 更新检查信号（线程池任务共用）
+        self._release_signals = ReleaseInfoSignals()
+        self._release_signals.fetched.connect(self._on_release_info, Qt.QueuedConnection)
+        self._inflight_release_checks = set()  # 进行中的检查，避免重复请求
+        self._progress_ui_ts = {}  # 各进度条上次刷新时间
+        self._pending_progress = {}  # 节流间隔内待补上的最新进度
+        # EasyTier区域在首次显示时才创建
+        self.easytier_section = None
+        self._me3_status_info = None  # 最近一次状态检查结果
+        self._saved_status_snapshot = None  # 已写入磁盘的状态，未变化时不重复写入
+        self._page_shown = False  # 页面显示前不发起联网的更新检查
+        self._me3_release_info = None  # 最近一次检查更新获取的发行版信息
+        # 运行库修复信号（修复期间按钮禁用，同一时间只有一个任务）
+        self._vcredist_signals = VCRedistSignals()
+        self._vcredist_signals.success.connect(self._update_vcredist_success_ui, Qt.QueuedConnection)
+        self._vcredist_signals.error.connect(self._update_vcredist_error_ui, Qt.QueuedConnection)
+        self._vcredist_signals.failed.connect(self._update_vcredist_failed_ui, Qt.QueuedConnection)
+
+        # 状态刷新防抖定时器，多次请求合并为一次检查
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.check_current_status)
         self.setup_content()
 
         # 注册语言切换观察者
         TranslationManager.instance().add_observer(self._on_language_changed)
 
-        # 延迟初始化下载管理器和状态检查
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(100, self.delayed_init)
+        # 页面构造完成后的下一次事件循环再初始化，不阻塞构造
+        QTimer.singleShot(0, self.delayed_init)
 
     def delayed_init(self):
-        """延迟初始化"""
-        # 异步检查状态，避免阻塞UI
-        QTimer.singleShot(100, self.check_current_status)
+        """延迟初始化：创建下载管理器并立即检查状态（耗时的探测在线程池中执行）"""
+        dm = self.get_download_manager()
+
+        # 先显示上次保存的状态，实际检查完成后再更正
+        snapshot = dm.load_status_snapshot()
+        if snapshot:
+            self._saved_status_snapshot = snapshot
+            self.on_status_checked(snapshot)
+        self.check_current_status()
 
     def get_download_manager(self):
         """获取下载管理器（确保已初始化）"""
         if self.download_manager is None:
             from ...utils.download_manager import DownloadManager
             self.download_manager = DownloadManager()
+            # 显式使用队列连接：发射方无论在哪个线程都不会同步执行界面更新
             # 连接EasyTier安装完成信号
-            self.download_manager.easytier_install_finished.connect(self.on_easytier_install_finished)
+            self.download_manager.easytier_install_finished.connect(self.on_easytier_install_finished, Qt.QueuedConnection)
             # 连接ME3安装程序下载完成信号
-            self.download_manager.me3_installer_download_finished.connect(self.on_me3_installer_download_finished)
+            self.download_manager.me3_installer_download_finished.connect(self.on_me3_installer_download_finished, Qt.QueuedConnection)
             # 连接OnlineFix下载完成信号
-            self.download_manager.onlinefix_download_finished.connect(self.on_onlinefix_download_finished)
+            self.download_manager.onlinefix_download_finished.connect(self.on_onlinefix_download_finished, Qt.QueuedConnection)
             # 连接OnlineFix下载进度信号
-            self.download_manager.onlinefix_download_progress.connect(self.update_onlinefix_progress)
+            self.download_manager.onlinefix_download_progress.connect(self.update_onlinefix_progress, Qt.QueuedConnection)
         return self.download_manager
 
     def setup_content(self):
         """设置页面内容"""
         # 使用水平布局来减少垂直空间占用
-        from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
-
         # 创建主容器
         main_container = QWidget()
         main_layout = QVBoxLayout(main_container)
@@ -232,39 +531,101 @@ class ToolDownloadPage(BasePage):
         me3_row_layout.addWidget(me3_widget, 2)  # ME3工具占2份
         me3_row_layout.addWidget(onlinefix_widget, 1)  # OnlineFix工具包占1份
 
-        # 第二行：EasyTier（重要工具）
-        easytier_widget = self.create_easytier_section()
+        # 第二行：EasyTier（重要工具），先放占位控件，首次显示时再创建
+        self.easytier_placeholder = QWidget()
+        easytier_placeholder_layout = QVBoxLayout(self.easytier_placeholder)
+        easytier_placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        self.easytier_placeholder.installEventFilter(self)
 
         main_layout.addWidget(me3_row_container)
-        main_layout.addWidget(easytier_widget)
+        main_layout.addWidget(self.easytier_placeholder)
 
         self.add_content(main_container)
         self.add_stretch()
     
-    def create_me3_section(self):
-        """创建ME3工具区域"""
-        self.me3_section = QGroupBox(t("me3_page.section.me3_tool"))
-        section = self.me3_section
-        section.setStyleSheet("""
-            QGroupBox {
-                color: #cdd6f4;
-                font-size: 16px;
-                font-weight: bold;
-                border: 2px solid #313244;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #89b4fa;
-            }
-        """)
+    def showEvent(self, event):
+        """页面首次显示时，在下一次事件循环发起更新检查（排在已投递的首帧绘制之后）"""
+        super().showEvent(event)
+        if not self._page_shown:
+            self._page_shown = True
+            # 联网检查在线程池中执行，命中版本号缓存时只更新标签，无需额外等待
+            QTimer.singleShot(0, self.start_update_check)
+
+    def eventFilter(self, obj, event):
+        """EasyTier占位控件首次显示时创建真实区域"""
+        if obj is self.easytier_placeholder and event.type() == QEvent.Show and self.easytier_section is None:
+            QTimer.singleShot(0, self.ensure_easytier_section)
+        return super().eventFilter(obj, event)
+
+    def ensure_easytier_section(self):
+        """创建EasyTier区域（仅一次）"""
+        if self.easytier_section is not None:
+            return
+        self.easytier_placeholder.removeEventFilter(self)
+        self.easytier_placeholder.layout().addWidget(self.create_easytier_section())
+
+        # 创建前的状态检查跳过了EasyTier，重新检查以获取其版本并检查更新
+        self.check_current_status()
+
+    def _create_tool_section(self, title, spacing=15):
+        """创建统一样式的工具区域，返回(分组框, 内容布局)"""
+        section = QGroupBox(title)
+        section.setObjectName("toolSection")
 
         layout = QVBoxLayout()
-        layout.setSpacing(15)
+        layout.setSpacing(spacing)
+        return section, layout
+
+    def _create_action_button(self, text, variant, slot):
+        """创建统一高度的操作按钮（variant为页面样式表中的按钮objectName）"""
+        button = QPushButton(text)
+        button.setFixedHeight(35)
+        button.setObjectName(variant)
+        button.clicked.connect(slot)
+        return button
+
+    def _create_button_row(self, buttons):
+        """将按钮依次加入水平行（末尾留伸缩）"""
+        btn_row = QHBoxLayout()
+        btn_row.setSpacing(10)
+        for button in buttons:
+            btn_row.addWidget(button)
+        btn_row.addStretch()
+        return btn_row
+
+    def _create_progress_bar(self):
+        """创建初始隐藏的下载进度条"""
+        progress_bar = QProgressBar()
+        progress_bar.setVisible(False)
+        progress_bar.setObjectName("toolProgress")
+        return progress_bar
+
+    def _create_version_type_row(self, label, first_text, second_text, spacing):
+        """创建版本类型选择行（标签+两个单选按钮），返回(容器, 单选1, 单选2)
+
+        默认选中第一个选项；信号由调用方在确定初始选项后再连接
+        """
+        label.setObjectName("versionTypeLabel")
+        first_radio = QRadioButton(first_text)
+        second_radio = QRadioButton(second_text)
+        first_radio.setObjectName("versionTypeRadio")
+        second_radio.setObjectName("versionTypeRadio")
+        first_radio.setChecked(True)
+
+        container = QWidget()
+        row_layout = QHBoxLayout(container)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.setSpacing(spacing)
+        row_layout.addWidget(label)
+        row_layout.addWidget(first_radio)
+        row_layout.addWidget(second_radio)
+        row_layout.addStretch()
+        return container, first_radio, second_radio
+
+    def create_me3_section(self):
+        """创建ME3工具区域"""
+        section, layout = self._create_tool_section(t("me3_page.section.me3_tool"))
+        self.me3_section = section
 
         # 版本信息卡片
         self.me3_version_card = VersionInfoCard()
@@ -282,29 +643,9 @@ class ToolDownloadPage(BasePage):
 
     def create_onlinefix_section(self):
         """创建OnlineFix工具包区域"""
-        section = QGroupBox(t("me3_page.onlinefix_section.title"))
+        section, layout = self._create_tool_section(t("me3_page.onlinefix_section.title"), spacing=12)
         # 保存组件引用用于语言切换
         self.onlinefix_section = section
-        section.setStyleSheet("""
-            QGroupBox {
-                color: #cdd6f4;
-                font-size: 16px;
-                font-weight: bold;
-                border: 2px solid #313244;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #89b4fa;
-            }
-        """)
-
-        layout = QVBoxLayout()
-        layout.setSpacing(12)
 
         # 版本信息卡片
         self.onlinefix_version_card = self.create_onlinefix_version_card()
@@ -319,14 +660,7 @@ class ToolDownloadPage(BasePage):
     def create_onlinefix_version_card(self):
         """创建OnlineFix版本信息卡片"""
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e2e;
-                border: 1px solid #313244;
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        card.setObjectName("onlinefixCard")  # 样式见_QSS_PAGE
 
         layout = QVBoxLayout()
         layout.setSpacing(6)
@@ -336,39 +670,17 @@ class ToolDownloadPage(BasePage):
         status_label = TLabel("me3_page.onlinefix_section.label.toolkit_status")
         # 保存组件引用用于语言切换
         self.onlinefix_status_title_label = status_label
-        status_label.setStyleSheet("""
-            QLabel {
-                color: #89b4fa;
-                font-size: 13px;
-                font-weight: bold;
-                margin-bottom: 4px;
-            }
-        """)
+        status_label.setObjectName("onlinefixTitle")
         layout.addWidget(status_label)
 
         # 状态信息
         self.onlinefix_status_label = QLabel(t("me3_page.onlinefix_section.status.checking"))
-        self.onlinefix_status_label.setStyleSheet("""
-            QLabel {
-                color: #fab387;
-                font-size: 12px;
-                padding: 4px 8px;
-                background-color: #313244;
-                border-radius: 4px;
-                border: 1px solid #fab387;
-            }
-        """)
+        self.onlinefix_status_label.setObjectName("onlinefixStatus")
         layout.addWidget(self.onlinefix_status_label)
 
         # 详细信息
         self.onlinefix_detail_label = QLabel(t("me3_page.onlinefix_section.detail.includes"))
-        self.onlinefix_detail_label.setStyleSheet("""
-            QLabel {
-                color: #6c7086;
-                font-size: 11px;
-                margin-top: 4px;
-            }
-        """)
+        self.onlinefix_detail_label.setObjectName("onlinefixDetail")
         layout.addWidget(self.onlinefix_detail_label)
 
         card.setLayout(layout)
@@ -384,48 +696,12 @@ class ToolDownloadPage(BasePage):
 
         # 下载按钮
         self.onlinefix_download_btn = QPushButton(t("me3_page.onlinefix_section.button.download"))
-        self.onlinefix_download_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #a6e3a1;
-                border: none;
-                border-radius: 6px;
-                color: #1e1e2e;
-                font-weight: bold;
-                padding: 8px 16px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #94d3a2;
-            }
-            QPushButton:pressed {
-                background-color: #82c3a3;
-            }
-            QPushButton:disabled {
-                background-color: #45475a;
-                color: #6c7086;
-            }
-        """)
+        self.onlinefix_download_btn.setObjectName("successButton")
         self.onlinefix_download_btn.clicked.connect(self.download_onlinefix)
 
         # 检查按钮
         self.onlinefix_check_btn = QPushButton(t("me3_page.onlinefix_section.button.check_status"))
-        self.onlinefix_check_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #74c7ec;
-                border: none;
-                border-radius: 6px;
-                color: #1e1e2e;
-                font-weight: bold;
-                padding: 8px 16px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #89dceb;
-            }
-            QPushButton:pressed {
-                background-color: #5fb3d4;
-            }
-        """)
+        self.onlinefix_check_btn.setObjectName("infoButton")
         self.onlinefix_check_btn.clicked.connect(self.check_onlinefix_status)
 
         button_layout.addWidget(self.onlinefix_download_btn)
@@ -436,23 +712,7 @@ class ToolDownloadPage(BasePage):
         layout.addWidget(button_container)
 
         # 进度条（初始隐藏）
-        self.onlinefix_progress = QProgressBar()
-        self.onlinefix_progress.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #313244;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #1e1e2e;
-                color: #cdd6f4;
-                font-size: 11px;
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background-color: #a6e3a1;
-                border-radius: 3px;
-            }
-        """)
-        self.onlinefix_progress.setVisible(False)
+        self.onlinefix_progress = self._create_progress_bar()
         layout.addWidget(self.onlinefix_progress)
 
     def create_me3_download_controls(self, layout):
@@ -463,193 +723,102 @@ class ToolDownloadPage(BasePage):
         button_layout.setContentsMargins(0, 0, 0, 0)
         button_layout.setSpacing(10)
 
-        # 按钮行
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(10)
-
         # 下载/更新按钮（便携版）
-        self.me3_download_btn = QPushButton(t("me3_page.button.download_portable"))
-        self.me3_download_btn.setFixedHeight(35)
-        self.me3_download_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #a6e3a1;
-                border: none;
-                border-radius: 6px;
-                color: #1e1e2e;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #94d3a2;
-            }
-            QPushButton:pressed {
-                background-color: #82c3a3;
-            }
-            QPushButton:disabled {
-                background-color: #45475a;
-                color: #6c7086;
-            }
-        """)
-        self.me3_download_btn.clicked.connect(self.start_me3_download)
-
-
-
-
+        self.me3_download_btn = self._create_action_button(
+            t("me3_page.button.download_portable"), "successButton", self.start_me3_download
+        )
 
         # 检查更新按钮
-        self.me3_check_update_btn = QPushButton(t("me3_page.button.check_update"))
-        self.me3_check_update_btn.setFixedHeight(35)
-        self.me3_check_update_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #89b4fa;
-                border: none;
-                border-radius: 6px;
-                color: #1e1e2e;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #74c7ec;
-            }
-            QPushButton:pressed {
-                background-color: #64a8d8;
-            }
-        """)
-        self.me3_check_update_btn.clicked.connect(self.check_me3_updates)
+        self.me3_check_update_btn = self._create_action_button(
+            t("me3_page.button.check_update"), "primaryButton", self.check_me3_updates
+        )
 
         # 运行库修复按钮
-        self.me3_vcredist_btn = QPushButton(t("me3_page.button.fix_runtime"))
-        self.me3_vcredist_btn.setFixedHeight(35)
-        self.me3_vcredist_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #fab387;
-                border: none;
-                border-radius: 6px;
-                color: #1e1e2e;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #f9c74f;
-            }
-            QPushButton:pressed {
-                background-color: #f8b500;
-            }
-            QPushButton:disabled {
-                background-color: #45475a;
-                color: #6c7086;
-            }
-        """)
-        self.me3_vcredist_btn.clicked.connect(self.fix_vcredist)
+        self.me3_vcredist_btn = self._create_action_button(
+            t("me3_page.button.fix_runtime"), "warningButton", self.fix_vcredist
+        )
 
         # 卸载安装版按钮
-        self.me3_uninstall_btn = QPushButton(t("me3_page.button.uninstall"))
-        self.me3_uninstall_btn.setFixedHeight(35)
-        self.me3_uninstall_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f38ba8;
-                border: none;
-                border-radius: 6px;
-                color: #1e1e2e;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #eba0ac;
-            }
-            QPushButton:pressed {
-                background-color: #d67a8a;
-            }
-            QPushButton:disabled {
-                background-color: #45475a;
-                color: #6c7086;
-            }
-        """)
-        self.me3_uninstall_btn.clicked.connect(self.uninstall_me3_full)
+        self.me3_uninstall_btn = self._create_action_button(
+            t("me3_page.button.uninstall"), "dangerButton", self.uninstall_me3_full
+        )
         self.me3_uninstall_btn.setVisible(False)  # 初始隐藏，根据安装状态动态显示
 
         # 取消下载按钮
-        self.me3_cancel_btn = QPushButton(t("me3_page.button.cancel"))
-        self.me3_cancel_btn.setFixedHeight(35)
-        self.me3_cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f38ba8;
-                border: none;
-                border-radius: 6px;
-                color: #1e1e2e;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #eba0ac;
-            }
-            QPushButton:pressed {
-                background-color: #d67a8a;
-            }
-        """)
-        self.me3_cancel_btn.clicked.connect(self.cancel_me3_download)
+        self.me3_cancel_btn = self._create_action_button(
+            t("me3_page.button.cancel"), "dangerButton", self.cancel_me3_download
+        )
         self.me3_cancel_btn.setVisible(False)
 
-        btn_row.addWidget(self.me3_download_btn)
-        btn_row.addWidget(self.me3_cancel_btn)
-        btn_row.addWidget(self.me3_check_update_btn)
-        btn_row.addWidget(self.me3_vcredist_btn)
-        btn_row.addWidget(self.me3_uninstall_btn)
-        btn_row.addStretch()
-
-        button_layout.addLayout(btn_row)
-
-
+        button_layout.addLayout(self._create_button_row([
+            self.me3_download_btn,
+            self.me3_cancel_btn,
+            self.me3_check_update_btn,
+            self.me3_vcredist_btn,
+            self.me3_uninstall_btn,
+        ]))
 
         button_container.setLayout(button_layout)
         layout.addWidget(button_container)
 
         # 进度条
-        self.me3_progress_bar = QProgressBar()
-        self.me3_progress_bar.setVisible(False)
-        self.me3_progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #313244;
-                border-radius: 4px;
-                background-color: #1e1e2e;
-                text-align: center;
-                color: #cdd6f4;
-                font-weight: bold;
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background-color: #a6e3a1;
-                border-radius: 3px;
-            }
-        """)
+        self.me3_progress_bar = self._create_progress_bar()
         layout.addWidget(self.me3_progress_bar)
 
-        # 移除状态标签组件
+    def schedule_status_refresh(self, delay_ms):
+        """延迟刷新状态（防抖：重复调用会重新计时，只执行一次）"""
+        # 下载/安装/卸载后本地状态已变化，清除安装检测缓存
+        self.get_download_manager().invalidate_install_cache()
+        self._refresh_timer.start(delay_ms)
 
     def check_current_status(self):
         """检查当前状态（异步）"""
         # 移除状态标签的文本设置
-        if hasattr(self, 'onlinefix_status_label'):
-            self.onlinefix_status_label.setText(t("me3_page.status.checking_status"))
-
-        # 如果已有工作线程在运行，先停止它
-        if self.status_check_worker and self.status_check_worker.isRunning():
-            self.status_check_worker.quit()
-            self.status_check_worker.wait()
+        self.onlinefix_status_label.setText(t("me3_page.status.checking_status"))
 
-        # 创建并启动状态检查工作线程
+        # 之前未完成的检查结果将被丢弃
+        self._status_generation += 1
         dm = self.get_download_manager()
-        self.status_check_worker = StatusCheckWorker(dm)
-        self.status_check_worker.status_checked.connect(self.on_status_checked)
-        self.status_check_worker.start()
+        include_easytier = self.easytier_section is not None
+        if dm.is_status_cache_warm(include_easytier):
+            # 全部命中缓存时只有几次stat，直接同步查询，省去线程往返
+            status_info = collect_status_info(dm, include_easytier)
+            self.on_status_checked(status_info)
+            self._save_status_snapshot(status_info)
+        else:
+            # 需要运行版本查询进程，提交到线程池
+            QThreadPool.globalInstance().start(StatusCheckRunnable(
+                dm, self._status_signals, self._status_generation, include_easytier
+            ))
+
+        # 同时发起ME3/EasyTier更新检查，网络请求与本地检查并行
+        # 页面尚未显示时不检查，首次显示后由showEvent发起
+        if self._page_shown:
+            self.start_update_check()
+
+    def _on_status_result(self, generation, status_info):
+        """线程池状态检查完成，只处理最新一次检查的结果"""
+        if generation == self._status_generation:
+            self.on_status_checked(status_info)
+            self._save_status_snapshot(status_info)
+
+    def _save_status_snapshot(self, status_info):
+        """保存实际检测到的状态，供下次启动时先行显示"""
+        if not status_info:
+            return
+        previous = self._saved_status_snapshot or {}
+        if 'easytier_version' not in status_info and 'easytier_version' in previous:
+            # 本次未探测EasyTier，沿用上次的结果
+            status_info = dict(status_info, easytier_version=previous['easytier_version'])
+        if status_info == previous:
+            return
+        self._saved_status_snapshot = status_info
+        self.get_download_manager().save_status_snapshot(status_info)
 
     def on_status_checked(self, status_info):
         """状态检查完成的回调"""
+        # 多个控件连续更新，暂停绘制合并为一次重绘
+        self.setUpdatesEnabled(False)
         try:
             # 更新ME3状态
             is_me3_installed = status_info.get('me3_installed', False)
@@ -666,95 +835,102 @@ class ToolDownloadPage(BasePage):
                 'me3_full_version': me3_full_version
             }
 
-            # 根据当前选择的版本类型更新显示
-            self.update_me3_version_display()
-
-
-
-            # 根据检测结果设置单选框状态
-            if is_me3_full_installed:
-                self.me3_full_radio.setChecked(True)
-            elif is_me3_installed:
-                self.me3_portable_radio.setChecked(True)
+            # 根据检测结果设置单选框状态（安装版已安装时选择安装版，否则默认选择便携版）
+            radio = self.me3_full_radio if is_me3_full_installed else self.me3_portable_radio
+            if radio.isChecked():
+                # 选择未变化时不会触发切换处理，手动调用以更新版本显示、卸载按钮和下载按钮文本
+                self.on_me3_version_type_changed()
             else:
-                # 默认选择便携版
-                self.me3_portable_radio.setChecked(True)
-
-            # 更新ME3版本显示（在设置单选框状态后）
-            self.update_me3_version_display()
-
-            # 更新卸载按钮显示状态
-            self.update_uninstall_button_visibility(is_me3_full_installed)
+                # 切换会触发on_me3_version_type_changed
+                radio.setChecked(True)
 
-            # 更新EasyTier状态
-            easytier_current_version = status_info.get('easytier_version')
-
-            if easytier_current_version:
-                self.easytier_version_card.update_info(
-                    current_version=easytier_current_version
-                )
-                # 移除动态提示文本
-            else:
+            # 更新EasyTier状态（区域未创建时不会探测其版本）
+            if self.easytier_section is not None and 'easytier_version' in status_info:
                 self.easytier_version_card.update_info(
-                    current_version=None
+                    current_version=status_info['easytier_version']
                 )
-                # 移除动态提示文本
 
             # 更新OnlineFix状态
-            if hasattr(self, 'onlinefix_status_label'):
-                self.check_onlinefix_status()
-
+            self.check_onlinefix_status()
 
 
-            # 启动异步更新检查
-            self.start_update_check()
 
         except Exception as e:
             print(f"处理状态检查结果失败: {e}")
             # 设置默认状态
             # 移除状态标签的文本设置
-            if hasattr(self, 'onlinefix_status_label'):
-                self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.status_check_failed"))
+            self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.status_check_failed"))
+        finally:
+            self.setUpdatesEnabled(True)
 
     def start_update_check(self):
-        """启动异步更新检查"""
-        # 移除状态标签的文本设置
+        """启动异步更新检查（ME3与EasyTier并行）"""
         # OnlineFix不需要检查最新版本，保持当前状态
+        self._start_release_check('me3')
+        # EasyTier区域未创建时，由ensure_easytier_section负责检查
+        if self.easytier_section is not None:
+            self._start_release_check('easytier')
 
-        # 如果已有更新检查线程在运行，先停止它
-        if self.update_check_worker and self.update_check_worker.isRunning():
-            self.update_check_worker.quit()
-            self.update_check_worker.wait()
+    def _start_release_check(self, tool, force=False):
+        """将指定工具的更新检查提交到线程池
 
-        # 创建并启动更新检查工作线程
+        版本号缓存未过期时直接使用缓存结果；force为True时清除版本号缓存重新检查，
+        此时短期的发行版信息缓存仍然有效，按住Shift点击时连同它一起跳过
+        """
         dm = self.get_download_manager()
 
         # 获取EasyTier版本类型选择
         include_prerelease = False
-        if hasattr(self, 'easytier_prerelease_radio') and self.easytier_prerelease_radio.isChecked():
+        if self.easytier_section is not None and self.easytier_prerelease_radio.isChecked():
             include_prerelease = True
 
-        self.update_check_worker = UpdateCheckWorker(dm, include_prerelease)
-        self.update_check_worker.me3_update_checked.connect(self.on_me3_update_checked)
-        self.update_check_worker.easytier_update_checked.connect(self.on_easytier_update_checked)
-        self.update_check_worker.start()
+        key = _release_check_key(tool, include_prerelease)
+        use_cache = True
+        if force:
+            dm.invalidate_release_tag(key)
+            use_cache = not (QApplication.keyboardModifiers() & Qt.ShiftModifier)
+        else:
+            cached_tag = dm.get_cached_release_tag(key)
+            if cached_tag:
+                self._on_release_info(tool, {
+                    'success': True,
+                    'latest_version': cached_tag,
+                    'include_prerelease': include_prerelease
+                })
+                return
+
+        # 相同的检查正在进行时直接复用其结果
+        if key in self._inflight_release_checks:
+            return
+        self._inflight_release_checks.add(key)
+
+        runnable = ReleaseInfoRunnable(tool, dm, self._release_signals, include_prerelease, use_cache)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_release_info(self, tool, result):
+        """线程池更新检查完成"""
+        self._inflight_release_checks.discard(
+            _release_check_key(tool, result.get('include_prerelease', False)))
+        if tool == 'me3':
+            self.on_me3_update_checked(result)
+        else:
+            self.on_easytier_update_checked(result)
 
     def on_me3_update_checked(self, result):
         """ME3更新检查完成"""
         try:
             if result.get('success', False):
                 latest_version = result.get('latest_version', t("me3_page.error.unknown"))
-                current_version = result.get('current_version')
+                # 使用缓存版本号时没有发行版信息，保留之前获取的（版本号一致时）
+                if result.get('release_info'):
+                    self._me3_release_info = result['release_info']
+                elif self._me3_release_info and self._me3_release_info.get('tag_name') != latest_version:
+                    self._me3_release_info = None
 
                 self.me3_version_card.update_info(latest_version=latest_version)
 
-                # 移除状态标签的文本设置
-                if current_version and current_version != latest_version:
-                    # 触发版本类型切换处理，更新按钮文本
-                    self.on_me3_version_type_changed()
-                elif current_version:
-                    # 触发版本类型切换处理，更新按钮文本
-                    self.on_me3_version_type_changed()
+                # 触发版本类型切换处理，按已安装版本与最新版本更新按钮文本
+                self.on_me3_version_type_changed()
             else:
                 error = result.get('error', t("me3_page.error.unknown_error"))
                 self.me3_version_card.update_info(latest_version=t("me3_page.error.get_failed"))
@@ -765,17 +941,18 @@ class ToolDownloadPage(BasePage):
 
     def on_easytier_update_checked(self, result):
         """EasyTier更新检查完成"""
+        # 下载过程中保持按钮禁用
+        if not self.easytier_progress.isVisible():
+            self.easytier_check_btn.setEnabled(True)
+
         try:
             if result.get('success', False):
-                has_update = result.get('has_update', False)
                 latest_version = result.get('latest_version')
-                current_version = result.get('current_version')
-                message = result.get('message', '')
                 include_prerelease = result.get('include_prerelease', False)
 
+                # 当前版本由状态检查结果更新，这里只更新最新版本
                 version_type = t("me3_page.version_type.prerelease") if include_prerelease else t("me3_page.version_type.release")
                 self.easytier_version_card.update_info(
-                    current_version=current_version,
                     latest_version=latest_version,
                     version_type=version_type
                 )
@@ -789,60 +966,13 @@ class ToolDownloadPage(BasePage):
             pass
 
     def check_me3_updates(self):
-        """检查ME3更新"""
-        # 移除状态标签的文本设置
-
-        try:
-            dm = self.get_download_manager()
-            release_info = dm.get_latest_release_info()
-            if release_info:
-                latest_version = release_info.get('tag_name', '未知')
-                self.me3_version_card.update_info(latest_version=latest_version)
-
-                # 检查是否需要更新（根据当前选择的版本类型）
-                version_type = "full" if self.me3_full_radio.isChecked() else "portable"
-                current_version = dm.get_version_by_type(version_type)
-                if current_version and current_version != latest_version:
-                    self.me3_download_btn.setText(t("me3_page.button.update"))
-                    # 移除动态提示文本
-                elif current_version:
-                    # 移除动态提示文本
-                    pass
-                else:
-                    # 移除动态提示文本
-                    pass
-            else:
-                self.me3_version_card.update_info(latest_version=t("me3_page.error.get_failed"))
-                # 移除状态标签的文本设置
-        except Exception as e:
-            # 移除状态标签的文本设置
-            pass
+        """检查ME3更新（后台执行，结果由on_me3_update_checked处理）"""
+        self._start_release_check('me3', force=True)
 
     def check_easytier_updates(self):
-        """检查EasyTier更新"""
-        try:
-            dm = self.get_download_manager()
-
-            # 获取版本类型选择
-            include_prerelease = False
-            if hasattr(self, 'easytier_prerelease_radio') and self.easytier_prerelease_radio.isChecked():
-                include_prerelease = True
+        """检查EasyTier更新（后台执行，结果由on_easytier_update_checked处理）"""
+        self._start_release_check('easytier')
 
-            has_update, latest_version, message = dm.check_easytier_update(include_prerelease)
-
-            # 更新界面
-            current_version = dm.get_current_easytier_version()
-            self.easytier_version_card.update_info(
-                current_version=current_version,
-                latest_version=latest_version
-            )
-
-            # 移除动态提示文本，不再需要更新按钮文本
-
-        except Exception as e:
-            print(f"检查EasyTier更新失败: {e}")
-            # 检查失败时不更新版本卡片，只更新状态标签
-    
     def start_me3_download(self):
         """开始ME3下载"""
         if self.me3_download_worker and self.me3_download_worker.isRunning():
@@ -868,7 +998,7 @@ class ToolDownloadPage(BasePage):
                 return
 
         # 下载便携版（使用智能镜像选择）
-        self.me3_download_worker = self.get_download_manager().download_me3()
+        self.me3_download_worker = self.get_download_manager().download_me3(release_info=self._me3_release_info)
         if not self.me3_download_worker:
             # 移除状态标签的文本设置
             return
@@ -895,7 +1025,7 @@ class ToolDownloadPage(BasePage):
             return
 
         # 下载ME3安装程序（使用智能镜像选择）
-        self.me3_installer_download_worker = self.get_download_manager().download_me3_installer()
+        self.me3_installer_download_worker = self.get_download_manager().download_me3_installer(release_info=self._me3_release_info)
         if not self.me3_installer_download_worker:
             # 移除状态标签的文本设置
             return
@@ -931,7 +1061,7 @@ class ToolDownloadPage(BasePage):
             self.me3_installer_download_worker.cancel()
             # 移除状态标签的文本设置
 
-            # 清理不完整的安装程序文件
+            # 已下载的分段保留在.part文件中供下次续传，这里只清理安装程序信息
             self.cleanup_incomplete_installer()
 
             self.reset_me3_download_ui()
@@ -959,22 +1089,12 @@ class ToolDownloadPage(BasePage):
                 print(f"已清理不完整的安装程序: {installer_path}")
 
                 # 清理version.json中的安装程序信息
-                version_file = download_manager.me3_dir / "version.json"
-                if version_file.exists():
+                if download_manager.version_file.exists():
                     try:
-                        import json
-                        with open(version_file, 'r', encoding='utf-8') as f:
-                            version_info = json.load(f)
-
-                        # 移除安装程序相关信息
-                        version_info.pop('installer_version', None)
-                        version_info.pop('installer_path', None)
-                        version_info.pop('installer_downloaded_at', None)
-                        version_info['installer_exists'] = False
-
-                        with open(version_file, 'w', encoding='utf-8') as f:
-                            json.dump(version_info, f, indent=2, ensure_ascii=False)
-
+                        download_manager.update_version_info(
+                            {'installer_exists': False},
+                            remove=('installer_version', 'installer_path', 'installer_downloaded_at')
+                        )
                     except Exception as e:
                         print(f"清理version.json失败: {e}")
 
@@ -983,17 +1103,39 @@ class ToolDownloadPage(BasePage):
 
     def update_me3_progress(self, value):
         """更新ME3下载进度"""
-        self.me3_progress_bar.setValue(value)
+        self._set_progress_throttled('me3', self.me3_progress_bar, value)
+
+    def update_easytier_progress(self, value):
+        """更新EasyTier下载进度"""
+        self._set_progress_throttled('easytier', self.easytier_progress, value)
+
+    def _set_progress_throttled(self, key, progress_bar, value):
+        """限制进度条刷新频率（不超过10次/秒），完成时总是刷新
+
+        间隔内到达的进度只保留最新值，在间隔结束时补上，避免进度停在较早的数值
+        """
+        now = time.monotonic()
+        elapsed = now - self._progress_ui_ts.get(key, 0.0)
+        if value < 100 and elapsed < self.PROGRESS_UI_INTERVAL:
+            if key not in self._pending_progress:
+                delay_ms = int((self.PROGRESS_UI_INTERVAL - elapsed) * 1000) + 1
+                QTimer.singleShot(delay_ms, lambda: self._flush_progress(key, progress_bar))
+            self._pending_progress[key] = value
+            return
+        self._pending_progress.pop(key, None)
+        self._progress_ui_ts[key] = now
+        progress_bar.setValue(value)
+
+    def _flush_progress(self, key, progress_bar):
+        """补上节流间隔内跳过的最新进度（下载已结束、进度条已隐藏时丢弃）"""
+        value = self._pending_progress.pop(key, None)
+        if value is not None and progress_bar.isVisible():
+            self._progress_ui_ts[key] = time.monotonic()
+            progress_bar.setValue(value)
 
     def fix_vcredist(self):
         """修复VC++运行库"""
         try:
-            import threading
-            import urllib.request
-            import subprocess
-            from pathlib import Path
-            from PySide6.QtCore import QObject, Signal, QThread
-
             # 移除状态标签的保存和设置
 
             # 禁用按钮，防止重复点击
@@ -1001,82 +1143,10 @@ class ToolDownloadPage(BasePage):
             self.me3_vcredist_btn.setText(t("me3_page.status.fixing"))
             # 移除状态标签的文本设置
 
-            # 创建信号发射器
-            class VCRedistWorker(QObject):
-                status_update = Signal(str)
-                success = Signal()
-                error = Signal(int)
-                finished = Signal()
-
-                def __init__(self, parent_widget):
-                    super().__init__()
-                    self.parent_widget = parent_widget
-
-                def run(self):
-                    try:
-                        # 创建tools目录
-                        download_manager = self.parent_widget.get_download_manager()
-                        tools_dir = download_manager.me3_dir / "tools"
-                        tools_dir.mkdir(exist_ok=True)
-
-                        # VC++运行库下载URL
-                        vcredist_url = "https://aka.ms/vs/17/release/vc_redist.x64.exe"
-                        vcredist_path = tools_dir / "vc_redist.x64.exe"
-                        log_path = tools_dir / "vcredist_install.log"
-
-                        # 下载VC++运行库
-                        self.status_update.emit(t("me3_page.status.downloading_vcredist"))
-
-                        # 使用带进度的下载
-                        def download_progress(block_num, block_size, total_size):
-                            if total_size > 0:
-                                percent = min(100, (block_num * block_size * 100) // total_size)
-                                self.status_update.emit(f"{t('me3_page.status.downloading_vcredist')} {percent}%")
-
-                        urllib.request.urlretrieve(vcredist_url, vcredist_path, download_progress)
-
-                        # 执行静默安装
-                        self.status_update.emit(t("me3_page.status.installing"))
-                        install_cmd = [
-                            str(vcredist_path),
-                            "/install",
-                            "/quiet",
-                            "/norestart",
-                            "/passive",
-                            "/log",
-                            str(log_path)
-                        ]
-
-                        import sys
-                        creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-                        result = subprocess.run(install_cmd, capture_output=True, text=True, creationflags=creation_flags)
-
-                        # 发射结果信号
-                        if result.returncode == 0:
-                            self.success.emit()
-                        else:
-                            self.error.emit(result.returncode)
-
-                    except Exception as e:
-                        self.status_update.emit(f"运行库修复失败: {str(e)}")
-                        print(f"VC++运行库修复失败: {e}")
-                    finally:
-                        self.finished.emit()
-
-            # 创建工作线程
-            self.vcredist_worker = VCRedistWorker(self)
-            self.vcredist_thread = QThread()
-            self.vcredist_worker.moveToThread(self.vcredist_thread)
-
-            # 连接信号
-            # 移除状态标签的信号连接
-            self.vcredist_worker.success.connect(self._update_vcredist_success_ui)
-            self.vcredist_worker.error.connect(self._update_vcredist_error_ui)
-            self.vcredist_worker.finished.connect(self._vcredist_cleanup)
-            self.vcredist_thread.started.connect(self.vcredist_worker.run)
-
-            # 启动线程
-            self.vcredist_thread.start()
+            # 提交到线程池执行，结果通过信号回到主线程
+            QThreadPool.globalInstance().start(
+                VCRedistRunnable(self.get_download_manager(), self._vcredist_signals)
+            )
 
         except Exception as e:
             # 移除状态标签的文本设置
@@ -1085,22 +1155,12 @@ class ToolDownloadPage(BasePage):
             self.me3_vcredist_btn.setText("运行库修复")
             print(f"VC++运行库修复失败: {e}")
 
-    def _vcredist_cleanup(self):
-        """清理VC++修复线程"""
-        if hasattr(self, 'vcredist_thread'):
-            self.vcredist_thread.quit()
-            self.vcredist_thread.wait()
-            self.vcredist_thread.deleteLater()
-            delattr(self, 'vcredist_thread')
-        if hasattr(self, 'vcredist_worker'):
-            self.vcredist_worker.deleteLater()
-            delattr(self, 'vcredist_worker')
-
     def _update_vcredist_success_ui(self):
         """更新VC++运行库修复成功的UI状态"""
         # 移除状态标签的文本和样式设置
         self.me3_vcredist_btn.setEnabled(True)
         self.me3_vcredist_btn.setText(t("me3_page.button.fix_runtime"))
+        self.me3_vcredist_btn.setToolTip(t("me3_page.status.vcredist_fixed"))
 
         # 移除定时器和状态清除逻辑
 
@@ -1109,20 +1169,38 @@ class ToolDownloadPage(BasePage):
         # 移除状态标签的文本和样式设置
         self.me3_vcredist_btn.setEnabled(True)
         self.me3_vcredist_btn.setText(t("me3_page.button.fix_runtime"))
+        self.me3_vcredist_btn.setToolTip(t("me3_page.status.vcredist_failed", code=error_code))
+
+    def _update_vcredist_failed_ui(self, message):
+        """下载或安装运行库出现异常时恢复按钮并显示失败原因"""
+        self.me3_vcredist_btn.setEnabled(True)
+        self.me3_vcredist_btn.setText(t("me3_page.button.fix_runtime"))
+        self.me3_vcredist_btn.setToolTip(f"运行库修复失败: {message}")
 
     def me3_download_finished(self, success, message):
         """ME3下载完成"""
+        worker = self.me3_download_worker
+        release_info = worker.release_info if worker else None
+        version = release_info.get('tag_name') if release_info else None
+
+        if success and version and self._me3_status_info is not None:
+            # 解压在完成信号发出前已结束，先按实际下载的版本更新状态，界面立即显示新版本
+            self._me3_status_info.update({
+                'is_me3_installed': True,
+                'me3_current_version': version
+            })
+
+        # 其中会按当前状态刷新版本显示和按钮文本
         self.reset_me3_download_ui()
 
         if success:
             # 移除状态标签的文本和样式设置
 
             # 保存便携版版本信息到version.json
-            self.save_portable_version_info()
+            self.save_portable_version_info(version)
 
-            # 延迟检查状态，避免覆盖成功消息
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(3000, self.check_current_status)
+            # 后台校验实际安装状态（在线程池中执行，不阻塞界面）
+            self.schedule_status_refresh(0)
             self.status_updated.emit()  # 发送状态更新信号
         else:
             # 移除状态标签的文本和样式设置
@@ -1132,75 +1210,39 @@ class ToolDownloadPage(BasePage):
 
     def create_me3_version_type_selection(self):
         """创建ME3版本类型选择"""
-        self.me3_version_type_container = QWidget()
-        self.me3_version_type_layout = QHBoxLayout(self.me3_version_type_container)
-        self.me3_version_type_layout.setContentsMargins(0, 0, 0, 0)
-        self.me3_version_type_layout.setSpacing(20)
-
-        self.me3_portable_radio = QRadioButton(t("me3_page.type.portable"))
-        self.me3_full_radio = QRadioButton(t("me3_page.type.full_install"))
-
-        # 设置单选框样式
-        radio_style = """
-            QRadioButton {
-                color: #cdd6f4;
-                font-size: 12px;
-                font-weight: bold;
-                spacing: 8px;
-            }
-            QRadioButton::indicator {
-                width: 14px;
-                height: 14px;
-            }
-            QRadioButton::indicator:unchecked {
-                border: 2px solid #6c7086;
-                border-radius: 7px;
-                background-color: transparent;
-            }
-            QRadioButton::indicator:checked {
-                border: 2px solid #89b4fa;
-                border-radius: 7px;
-                background-color: #89b4fa;
-            }
-        """
-
-        self.me3_portable_radio.setStyleSheet(radio_style)
-        self.me3_full_radio.setStyleSheet(radio_style)
-
+        self.me3_version_type_label = QLabel(t("me3_page.label.version_type"))
         # 默认选择便携版
-        self.me3_portable_radio.setChecked(True)
+        (self.me3_version_type_container,
+         self.me3_portable_radio,
+         self.me3_full_radio) = self._create_version_type_row(
+            self.me3_version_type_label,
+            t("me3_page.type.portable"),
+            t("me3_page.type.full_install"),
+            spacing=20,
+        )
 
         # 连接信号
         self.me3_portable_radio.toggled.connect(self.on_me3_version_type_changed)
         self.me3_full_radio.toggled.connect(self.on_me3_version_type_changed)
 
-        # 创建标签
-        self.me3_version_type_label = QLabel(t("me3_page.label.version_type"))
-        self.me3_version_type_label.setStyleSheet("""
-            QLabel {
-                color: #cdd6f4;
-                font-size: 12px;
-                font-weight: bold;
-            }
-        """)
-
-        self.me3_version_type_layout.addWidget(self.me3_version_type_label)
-        self.me3_version_type_layout.addWidget(self.me3_portable_radio)
-        self.me3_version_type_layout.addWidget(self.me3_full_radio)
-        self.me3_version_type_layout.addStretch()
-
-    def on_me3_version_type_changed(self):
+    def on_me3_version_type_changed(self, checked=True):
         """ME3版本类型切换处理"""
+        # 切换时两个单选框各发出一次toggled，只处理被选中的那一次
+        if not checked:
+            return
+
         # 更新版本显示
         self.update_me3_version_display()
 
         # 更新状态提示文本
         self.update_me3_status_text()
 
-        # 获取当前状态
+        # 获取当前状态：文件检查只有几次stat，直接进行；安装版检测和版本号需要运行进程，
+        # 使用最近一次状态检查（在线程池中完成）的结果，避免在界面线程中执行me3 -V
         download_manager = self.get_download_manager()
+        status_info = self._me3_status_info or {}
         is_portable_installed = download_manager.is_me3_installed()
-        is_full_installed = download_manager.is_me3_full_installed()
+        is_full_installed = status_info.get('is_me3_full_installed', False)
 
         # 检查是否存在安装程序
         installer_path = download_manager.me3_dir / "me3_installer.exe"
@@ -1214,41 +1256,41 @@ class ToolDownloadPage(BasePage):
             if is_portable_installed:
                 # 检查是否有版本更新（使用统一版本获取接口）
                 try:
-                    current_version = download_manager.get_version_by_type("portable")
-                    latest_version = getattr(self.me3_version_card, 'latest_version', None)
+                    current_version = status_info.get('me3_current_version')
+                    latest_version = self.me3_version_card.latest_version
 
                     if current_version and latest_version and current_version != latest_version:
-                        self.me3_download_btn.setText(t("me3_page.button.get_update_portable"))
+                        _set_text_if_changed(self.me3_download_btn, t("me3_page.button.get_update_portable"))
                     else:
-                        self.me3_download_btn.setText(t("me3_page.button.redownload_portable"))
+                        _set_text_if_changed(self.me3_download_btn, t("me3_page.button.redownload_portable"))
                 except Exception as e:
                     print(f"版本比较失败: {e}")
-                    self.me3_download_btn.setText(t("me3_page.button.redownload_portable"))
+                    _set_text_if_changed(self.me3_download_btn, t("me3_page.button.redownload_portable"))
             else:
-                self.me3_download_btn.setText(t("me3_page.button.download_portable"))
+                _set_text_if_changed(self.me3_download_btn, t("me3_page.button.download_portable"))
         else:
             # 选择完整安装版
             if is_full_installed:
                 # 检查是否有版本更新（使用统一版本获取接口）
                 try:
-                    current_version = download_manager.get_version_by_type("full")
-                    latest_version = getattr(self.me3_version_card, 'latest_version', None)
+                    current_version = status_info.get('me3_full_version')
+                    latest_version = self.me3_version_card.latest_version
 
                     if current_version and latest_version and current_version != latest_version:
-                        self.me3_download_btn.setText(t("me3_page.button.get_update_full"))
+                        _set_text_if_changed(self.me3_download_btn, t("me3_page.button.get_update_full"))
                     else:
-                        self.me3_download_btn.setText(t("me3_page.button.redownload_full"))
+                        _set_text_if_changed(self.me3_download_btn, t("me3_page.button.redownload_full"))
                 except Exception as e:
                     print(f"版本比较失败: {e}")
-                    self.me3_download_btn.setText(t("me3_page.button.redownload_full"))
+                    _set_text_if_changed(self.me3_download_btn, t("me3_page.button.redownload_full"))
             elif installer_exists:
-                self.me3_download_btn.setText(t("me3_page.button.install"))
+                _set_text_if_changed(self.me3_download_btn, t("me3_page.button.install"))
             else:
-                self.me3_download_btn.setText(t("me3_page.button.download_full"))
+                _set_text_if_changed(self.me3_download_btn, t("me3_page.button.download_full"))
 
     def update_me3_version_display(self):
         """根据当前选择的版本类型更新ME3版本显示"""
-        if not hasattr(self, '_me3_status_info'):
+        if self._me3_status_info is None:
             return
 
         status_info = self._me3_status_info
@@ -1296,29 +1338,9 @@ class ToolDownloadPage(BasePage):
 
     def create_easytier_section(self):
         """创建EasyTier工具区域"""
-        section = QGroupBox(t("me3_page.easytier_section.title"))
+        section, layout = self._create_tool_section(t("me3_page.easytier_section.title"))
         # 保存组件引用用于语言切换
         self.easytier_section = section
-        section.setStyleSheet("""
-            QGroupBox {
-                color: #cdd6f4;
-                font-size: 16px;
-                font-weight: bold;
-                border: 2px solid #313244;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #89b4fa;
-            }
-        """)
-
-        layout = QVBoxLayout()
-        layout.setSpacing(15)
 
         # 版本信息卡片
         self.easytier_version_card = VersionInfoCard()
@@ -1327,8 +1349,6 @@ class ToolDownloadPage(BasePage):
         # EasyTier下载控制区域
         self.create_easytier_download_controls(layout)
 
-
-
         section.setLayout(layout)
         return section
 
@@ -1341,55 +1361,20 @@ class ToolDownloadPage(BasePage):
         button_layout.setSpacing(10)
 
         # 版本类型选择区域
-        version_type_container = QWidget()
-        version_type_layout = QHBoxLayout()
-        version_type_layout.setContentsMargins(0, 0, 0, 0)
-        version_type_layout.setSpacing(10)
-
-        version_type_label = TLabel("me3_page.easytier_section.label.version_type")
-        version_type_label.setStyleSheet("""
-            QLabel {
-                color: #cdd6f4;
-                font-size: 13px;
-                font-weight: bold;
-                min-width: 70px;
-            }
-        """)
         # 保存组件引用用于语言切换
-        self.easytier_version_type_label = version_type_label
-
-        # 版本类型选择单选按钮
-        self.easytier_release_radio = QRadioButton(t("me3_page.easytier_section.type.release"))
-        self.easytier_prerelease_radio = QRadioButton(t("me3_page.easytier_section.type.prerelease"))
+        self.easytier_version_type_label = TLabel("me3_page.easytier_section.label.version_type")
+        (version_type_container,
+         self.easytier_release_radio,
+         self.easytier_prerelease_radio) = self._create_version_type_row(
+            self.easytier_version_type_label,
+            t("me3_page.easytier_section.type.release"),
+            t("me3_page.easytier_section.type.prerelease"),
+            spacing=10,
+        )
 
         # 根据当前安装的版本类型自动选择
         self.auto_select_version_type()
 
-        # 设置单选按钮样式
-        radio_style = """
-            QRadioButton {
-                color: #cdd6f4;
-                font-size: 12px;
-                spacing: 5px;
-            }
-            QRadioButton::indicator {
-                width: 14px;
-                height: 14px;
-            }
-            QRadioButton::indicator:unchecked {
-                border: 2px solid #6c7086;
-                border-radius: 7px;
-                background-color: #1e1e2e;
-            }
-            QRadioButton::indicator:checked {
-                border: 2px solid #89b4fa;
-                border-radius: 7px;
-                background-color: #89b4fa;
-            }
-        """
-        self.easytier_release_radio.setStyleSheet(radio_style)
-        self.easytier_prerelease_radio.setStyleSheet(radio_style)
-
         # 连接信号，当版本类型改变时自动检查更新
         self.easytier_release_radio.toggled.connect(self.on_easytier_version_type_changed)
         self.easytier_prerelease_radio.toggled.connect(self.on_easytier_version_type_changed)
@@ -1400,100 +1385,30 @@ class ToolDownloadPage(BasePage):
         self.easytier_version_check_timer.timeout.connect(self.delayed_easytier_version_check)
         self.easytier_version_check_timer.setInterval(300)  # 300ms防抖延迟
 
-        version_type_layout.addWidget(version_type_label)
-        version_type_layout.addWidget(self.easytier_release_radio)
-        version_type_layout.addWidget(self.easytier_prerelease_radio)
-        version_type_layout.addStretch()
-
-        version_type_container.setLayout(version_type_layout)
         button_layout.addWidget(version_type_container)
 
-        # 按钮行
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(10)
-
         # 下载/更新按钮
-        self.easytier_download_btn = QPushButton(t("me3_page.easytier_section.button.download"))
-        self.easytier_download_btn.setFixedHeight(35)
-        self.easytier_download_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #a6e3a1;
-                border: none;
-                border-radius: 6px;
-                color: #1e1e2e;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #94d3a2;
-            }
-            QPushButton:pressed {
-                background-color: #7dc383;
-            }
-            QPushButton:disabled {
-                background-color: #6c7086;
-                color: #45475a;
-            }
-        """)
-        self.easytier_download_btn.clicked.connect(self.download_easytier)
+        self.easytier_download_btn = self._create_action_button(
+            t("me3_page.easytier_section.button.download"), "successButton", self.download_easytier
+        )
 
         # 检查更新按钮
-        self.easytier_check_btn = QPushButton(t("me3_page.easytier_section.button.check_update"))
-        self.easytier_check_btn.setFixedHeight(35)
-        self.easytier_check_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #89b4fa;
-                border: none;
-                border-radius: 6px;
-                color: #1e1e2e;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #74c7ec;
-            }
-            QPushButton:pressed {
-                background-color: #5fb3d4;
-            }
-            QPushButton:disabled {
-                background-color: #6c7086;
-                color: #45475a;
-            }
-        """)
-        self.easytier_check_btn.clicked.connect(self.check_easytier_update)
-
-        btn_row.addWidget(self.easytier_download_btn)
-        btn_row.addWidget(self.easytier_check_btn)
-        btn_row.addStretch()
+        self.easytier_check_btn = self._create_action_button(
+            t("me3_page.easytier_section.button.check_update"), "primaryButton", self.check_easytier_update
+        )
 
-        button_layout.addLayout(btn_row)
+        button_layout.addLayout(self._create_button_row([
+            self.easytier_download_btn,
+            self.easytier_check_btn,
+        ]))
 
         # 进度条
-        self.easytier_progress = QProgressBar()
-        self.easytier_progress.setVisible(False)
-        self.easytier_progress.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #313244;
-                border-radius: 6px;
-                text-align: center;
-                background-color: #1e1e2e;
-                color: #cdd6f4;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #a6e3a1;
-                border-radius: 4px;
-            }
-        """)
+        self.easytier_progress = self._create_progress_bar()
         button_layout.addWidget(self.easytier_progress)
 
         button_container.setLayout(button_layout)
         layout.addWidget(button_container)
 
-        # 移除状态标签组件
-
     def auto_select_version_type(self):
         """根据当前安装的版本类型自动选择单选框"""
         try:
@@ -1513,21 +1428,14 @@ class ToolDownloadPage(BasePage):
 
     def on_easytier_version_type_changed(self):
         """版本类型改变时的回调"""
-        # 显示切换状态
-        if hasattr(self, 'easytier_version_card'):
-            version_type = "预发行版" if (hasattr(self, 'easytier_prerelease_radio') and
-                                      self.easytier_prerelease_radio.isChecked()) else "正式版"
-            # 版本类型切换时不更新版本卡片，只更新状态标签
-
+        # 版本类型切换时不更新版本卡片
         # 使用防抖定时器，避免快速切换时频繁请求
-        if hasattr(self, 'easytier_version_check_timer'):
-            self.easytier_version_check_timer.stop()
-            self.easytier_version_check_timer.start()
+        self.easytier_version_check_timer.stop()
+        self.easytier_version_check_timer.start()
 
     def delayed_easytier_version_check(self):
-        """延迟执行的版本检查"""
-        if hasattr(self, 'easytier_version_card'):
-            self.check_easytier_update()
+        """延迟执行的版本检查（切换版本类型时优先使用缓存）"""
+        self._start_release_check('easytier')
 
     def download_easytier(self):
         """下载EasyTier"""
@@ -1546,9 +1454,7 @@ class ToolDownloadPage(BasePage):
             # 移除状态标签的文本设置
 
             # 获取版本类型选择
-            include_prerelease = False
-            if hasattr(self, 'easytier_prerelease_radio') and self.easytier_prerelease_radio.isChecked():
-                include_prerelease = True
+            include_prerelease = self.easytier_prerelease_radio.isChecked()
 
             # 开始下载（使用智能镜像选择）
             success = download_manager.download_easytier(
@@ -1557,8 +1463,8 @@ class ToolDownloadPage(BasePage):
 
             if success:
                 # 连接进度信号
-                if hasattr(download_manager, 'easytier_download_worker') and download_manager.easytier_download_worker:
-                    download_manager.easytier_download_worker.progress.connect(self.easytier_progress.setValue)
+                if download_manager.easytier_download_worker is not None:
+                    download_manager.easytier_download_worker.progress.connect(self.update_easytier_progress)
             else:
                 # 移除状态标签的文本设置
                 self.easytier_download_btn.setEnabled(True)
@@ -1574,57 +1480,26 @@ class ToolDownloadPage(BasePage):
 
     def check_easytier_update(self):
         """检查EasyTier更新"""
-        try:
-            download_manager = self.get_download_manager()
-
-            # 禁用按钮
-            self.easytier_check_btn.setEnabled(False)
-            # 检查中时不更新版本卡片，只更新状态标签
-
-            # 获取版本类型选择
-            include_prerelease = False
-            if hasattr(self, 'easytier_prerelease_radio') and self.easytier_prerelease_radio.isChecked():
-                include_prerelease = True
-
-            # 检查更新
-            has_update, latest_version, message = download_manager.check_easytier_update(include_prerelease)
-
-            # 更新界面
-            current_version = download_manager.get_current_easytier_version()
-            version_type = t("me3_page.version_type.prerelease") if include_prerelease else t("me3_page.version_type.release")
-            self.easytier_version_card.update_info(
-                current_version=current_version,
-                latest_version=latest_version,
-                version_type=version_type
-            )
-
-            # 移除动态提示文本
-
-        except Exception as e:
-            print(f"检查EasyTier更新失败: {e}")
-            # 检查失败时不更新版本卡片，只更新状态标签
-        finally:
-            self.easytier_check_btn.setEnabled(True)
+        # 禁用按钮，检查完成后在on_easytier_update_checked中恢复
+        self.easytier_check_btn.setEnabled(False)
+        self._start_release_check('easytier', force=True)
 
     def on_easytier_install_finished(self, success: bool, message: str):
         """EasyTier安装完成回调"""
         try:
             # 隐藏进度条
-            if hasattr(self, 'easytier_progress'):
-                self.easytier_progress.setVisible(False)
+            self.easytier_progress.setVisible(False)
 
             # 重新启用按钮
-            if hasattr(self, 'easytier_download_btn'):
-                self.easytier_download_btn.setEnabled(True)
-            if hasattr(self, 'easytier_check_btn'):
-                self.easytier_check_btn.setEnabled(True)
+            self.easytier_download_btn.setEnabled(True)
+            self.easytier_check_btn.setEnabled(True)
 
             if success:
                 # 安装成功
                 # 移除状态标签的文本和样式设置
 
                 # 重新检查状态
-                self.check_current_status()
+                self.schedule_status_refresh(0)
             else:
                 # 移除状态标签的文本和样式设置
                 pass
@@ -1634,13 +1509,15 @@ class ToolDownloadPage(BasePage):
     def on_me3_installer_download_finished(self, success: bool, message: str, installer_path: str):
         """ME3安装程序下载完成回调"""
         try:
+            worker = self.me3_installer_download_worker
+            release_info = worker.release_info if worker else None
             self.reset_me3_download_ui()
 
             if success:
                 # 移除状态标签的文本和样式设置
 
-                # 保存版本信息到version.json
-                self.save_installer_version_info(installer_path)
+                # 保存版本信息到version.json（按实际下载的发行版记录）
+                self.save_installer_version_info(installer_path, release_info)
 
                 # 更新按钮文本
                 self.on_me3_version_type_changed()
@@ -1653,97 +1530,56 @@ class ToolDownloadPage(BasePage):
         except Exception as e:
             print(f"处理ME3安装程序下载完成回调失败: {e}")
 
-    def save_installer_version_info(self, installer_path: str):
-        """保存安装程序版本信息到version.json"""
+    def save_installer_version_info(self, installer_path: str, release_info: dict = None):
+        """保存安装程序版本信息到version.json
+
+        Args:
+            release_info: 实际下载的发行版信息，版本号和下载链接都取自它
+        """
         try:
-            import json
-            from pathlib import Path
-            from datetime import datetime
 
             # 获取下载管理器
             download_manager = self.get_download_manager()
-            version_file = download_manager.me3_dir / "version.json"
 
-            # 读取现有版本信息
-            version_info = {}
-            if version_file.exists():
-                try:
-                    with open(version_file, 'r', encoding='utf-8') as f:
-                        version_info = json.load(f)
-                except:
-                    version_info = {}
-
-            # 获取当前最新版本信息
-            latest_version = getattr(self, '_latest_me3_version', None)
-            if not latest_version:
-                # 如果没有缓存的版本信息，尝试从版本卡片获取
-                if hasattr(self, 'me3_version_card'):
-                    latest_version = self.me3_version_card.latest_version
+            # 使用实际下载的版本号（版本卡片上的最新版本可能是获取失败的提示文本）
+            latest_version = release_info.get('tag_name') if release_info else None
 
             # 获取下载链接而不是本地路径
             download_url = None
             try:
-                release_info = download_manager.get_latest_release_info()
                 if release_info:
                     download_url = download_manager.get_installer_download_url(release_info)
             except Exception as e:
                 print(f"获取下载链接失败: {e}")
 
-            # 更新安装程序信息
-            version_info.update({
+            # 更新安装程序信息（只改动这些字段，保留其余内容）
+            download_manager.update_version_info({
                 'installer_version': latest_version or 'unknown',
                 'installer_path': download_url or str(installer_path),  # 优先使用下载链接
                 'installer_downloaded_at': str(datetime.now()),
                 'installer_exists': True
             })
 
-            # 保存到文件
-            with open(version_file, 'w', encoding='utf-8') as f:
-                json.dump(version_info, f, indent=2, ensure_ascii=False)
-
             print(f"安装程序版本信息已保存: {latest_version}, 下载链接: {download_url}")
 
         except Exception as e:
             print(f"保存安装程序版本信息失败: {e}")
 
-    def save_portable_version_info(self):
-        """保存便携版版本信息到version.json"""
-        try:
-            import json
-            from pathlib import Path
-            from datetime import datetime
-
-            # 获取下载管理器
-            download_manager = self.get_download_manager()
-            version_file = download_manager.me3_dir / "version.json"
+    def save_portable_version_info(self, latest_version: str = None):
+        """保存便携版版本信息到version.json
 
-            # 读取现有版本信息
-            version_info = {}
-            if version_file.exists():
-                try:
-                    with open(version_file, 'r', encoding='utf-8') as f:
-                        version_info = json.load(f)
-                except:
-                    version_info = {}
-
-            # 获取当前最新版本信息
-            latest_version = getattr(self, '_latest_me3_version', None)
-            if not latest_version:
-                # 如果没有缓存的版本信息，尝试从版本卡片获取
-                if hasattr(self, 'me3_version_card'):
-                    latest_version = self.me3_version_card.latest_version
+        Args:
+            latest_version: 实际下载的版本号（取自下载的发行版信息）
+        """
+        try:
 
-            # 更新便携版信息
-            version_info.update({
+            # 更新便携版信息（只改动这些字段，保留其余内容）
+            self.get_download_manager().update_version_info({
                 'portable_version': latest_version or 'unknown',
                 'portable_downloaded_at': str(datetime.now()),
                 'portable_installed': True
             })
 
-            # 保存到文件
-            with open(version_file, 'w', encoding='utf-8') as f:
-                json.dump(version_info, f, indent=2, ensure_ascii=False)
-
             print(f"便携版版本信息已保存: {latest_version}")
 
         except Exception as e:
@@ -1752,8 +1588,6 @@ class ToolDownloadPage(BasePage):
     def install_me3_now(self, installer_path: str):
         """立即安装ME3"""
         try:
-            import subprocess
-            import os
 
             # 使用统一的安装路径
             install_dir = f"{os.environ.get('LOCALAPPDATA', '')}\\Programs\\garyttierney\\me3"
@@ -1762,12 +1596,10 @@ class ToolDownloadPage(BasePage):
             # 移除状态标签的文本设置
 
             # 在后台运行安装程序
-            import sys
             creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
             process = subprocess.Popen(cmd, creationflags=creation_flags)
 
             # 使用定时器检查安装进度
-            from PySide6.QtCore import QTimer
             self.install_check_timer = QTimer()
             self.install_check_timer.timeout.connect(lambda: self.check_install_progress(process, install_dir))
             self.install_check_timer.start(1000)  # 每秒检查一次
@@ -1785,13 +1617,11 @@ class ToolDownloadPage(BasePage):
                 self.install_check_timer.stop()
 
                 # 检查安装是否成功
-                from pathlib import Path
                 me3_exe = Path(install_dir) / "bin" / "me3.exe"
                 if me3_exe.exists():
                     # 移除状态标签的文本和样式设置
                     # 重新检查状态
-                    from PySide6.QtCore import QTimer
-                    QTimer.singleShot(2000, self.check_current_status)
+                    self.schedule_status_refresh(2000)
                 else:
                     # 移除状态标签的文本和样式设置
                     pass
@@ -1814,32 +1644,14 @@ class ToolDownloadPage(BasePage):
 
             # 更新状态
             self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.downloading"))
-            self.onlinefix_status_label.setStyleSheet("""
-                QLabel {
-                    color: #fab387;
-                    font-size: 12px;
-                    padding: 4px 8px;
-                    background-color: #313244;
-                    border-radius: 4px;
-                    border: 1px solid #fab387;
-                }
-            """)
+            self._set_onlinefix_status_state('checking')
 
             # 开始下载
             success = download_manager.download_onlinefix()
             if not success:
                 self.reset_onlinefix_download_ui()
                 self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.start_failed"))
-                self.onlinefix_status_label.setStyleSheet("""
-                    QLabel {
-                        color: #f38ba8;
-                        font-size: 12px;
-                        padding: 4px 8px;
-                        background-color: #313244;
-                        border-radius: 4px;
-                        border: 1px solid #f38ba8;
-                    }
-                """)
+                self._set_onlinefix_status_state('error')
 
         except Exception as e:
             print(f"下载OnlineFix失败: {e}")
@@ -1853,35 +1665,17 @@ class ToolDownloadPage(BasePage):
 
             # 检查OnlineFix是否可用
             if download_manager.is_onlinefix_available():
-                self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.complete"))
-                self.onlinefix_status_label.setStyleSheet("""
-                    QLabel {
-                        color: #a6e3a1;
-                        font-size: 12px;
-                        padding: 4px 8px;
-                        background-color: #313244;
-                        border-radius: 4px;
-                        border: 1px solid #a6e3a1;
-                    }
-                """)
-                self.onlinefix_detail_label.setText(t("me3_page.onlinefix_section.detail.ready"))
+                _set_text_if_changed(self.onlinefix_status_label, t("me3_page.onlinefix_section.status.complete"))
+                self._set_onlinefix_status_state('ok')
+                _set_text_if_changed(self.onlinefix_detail_label, t("me3_page.onlinefix_section.detail.ready"))
             else:
-                self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.missing"))
-                self.onlinefix_status_label.setStyleSheet("""
-                    QLabel {
-                        color: #f38ba8;
-                        font-size: 12px;
-                        padding: 4px 8px;
-                        background-color: #313244;
-                        border-radius: 4px;
-                        border: 1px solid #f38ba8;
-                    }
-                """)
-                self.onlinefix_detail_label.setText(t("me3_page.onlinefix_section.detail.need_download"))
+                _set_text_if_changed(self.onlinefix_status_label, t("me3_page.onlinefix_section.status.missing"))
+                self._set_onlinefix_status_state('error')
+                _set_text_if_changed(self.onlinefix_detail_label, t("me3_page.onlinefix_section.detail.need_download"))
 
         except Exception as e:
             print(f"检查OnlineFix状态失败: {e}")
-            self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.check_failed"))
+            _set_text_if_changed(self.onlinefix_status_label, t("me3_page.onlinefix_section.status.check_failed"))
 
     def on_onlinefix_download_finished(self, success: bool, message: str):
         """OnlineFix下载完成回调"""
@@ -1890,32 +1684,13 @@ class ToolDownloadPage(BasePage):
 
             if success:
                 self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.download_complete"))
-                self.onlinefix_status_label.setStyleSheet("""
-                    QLabel {
-                        color: #a6e3a1;
-                        font-size: 12px;
-                        padding: 4px 8px;
-                        background-color: #313244;
-                        border-radius: 4px;
-                        border: 1px solid #a6e3a1;
-                    }
-                """)
+                self._set_onlinefix_status_state('ok')
                 self.onlinefix_detail_label.setText(t("me3_page.onlinefix_section.detail.installed"))
                 # 延迟一点时间确保文件系统同步，然后重新检查状态
-                from PySide6.QtCore import QTimer
                 QTimer.singleShot(500, self.check_onlinefix_status)
             else:
                 self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.download_failed"))
-                self.onlinefix_status_label.setStyleSheet("""
-                    QLabel {
-                        color: #f38ba8;
-                        font-size: 12px;
-                        padding: 4px 8px;
-                        background-color: #313244;
-                        border-radius: 4px;
-                        border: 1px solid #f38ba8;
-                    }
-                """)
+                self._set_onlinefix_status_state('error')
                 self.onlinefix_detail_label.setText(t("me3_page.onlinefix_section.detail.error").format(message=message))
 
         except Exception as e:
@@ -1924,10 +1699,19 @@ class ToolDownloadPage(BasePage):
     def update_onlinefix_progress(self, progress: int):
         """更新OnlineFix下载进度"""
         try:
-            self.onlinefix_progress.setValue(progress)
+            self._set_progress_throttled('onlinefix', self.onlinefix_progress, progress)
         except Exception as e:
             print(f"更新OnlineFix下载进度失败: {e}")
 
+    def _set_onlinefix_status_state(self, state):
+        """切换OnlineFix状态标签样式（checking/ok/error），只重新应用样式不重新解析"""
+        label = self.onlinefix_status_label
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
+
     def reset_onlinefix_download_ui(self):
         """重置OnlineFix下载UI状态"""
         try:
@@ -1957,8 +1741,7 @@ class ToolDownloadPage(BasePage):
                 self.me3_uninstall_btn.setVisible(False)
 
                 # 延迟刷新状态
-                from PySide6.QtCore import QTimer
-                QTimer.singleShot(2000, self.check_current_status)
+                self.schedule_status_refresh(2000)
 
             else:
                 # 移除状态标签的文本和样式设置
@@ -1978,201 +1761,124 @@ class ToolDownloadPage(BasePage):
     def update_uninstall_button_visibility(self, is_me3_full_installed):
         """更新卸载按钮的显示状态"""
         try:
-            if hasattr(self, 'me3_uninstall_btn'):
-                # 只有在检测到安装版时才显示卸载按钮
-                self.me3_uninstall_btn.setVisible(is_me3_full_installed)
+            # 只有在检测到安装版时才显示卸载按钮
+            self.me3_uninstall_btn.setVisible(is_me3_full_installed)
 
-                if is_me3_full_installed:
-                    # 确保按钮可用且文本正确
-                    self.me3_uninstall_btn.setEnabled(True)
-                    self.me3_uninstall_btn.setText(t("me3_page.button.uninstall"))
+            if is_me3_full_installed:
+                # 确保按钮可用且文本正确
+                self.me3_uninstall_btn.setEnabled(True)
+                self.me3_uninstall_btn.setText(t("me3_page.button.uninstall"))
 
         except Exception as e:
             print(f"更新卸载按钮显示状态失败: {e}")
 
+    def _retranslate_version_card(self, card):
+        """按当前语言重新生成版本卡片文本（ME3与EasyTier卡片共用）"""
+        try:
+            # 重新获取当前状态并更新显示
+            current_version = card.current_version_label.text().split(': ')[-1].split(' (')[0]
+            latest_text = card.latest_version_label.text()
+            latest_version = latest_text.split(': ')[-1].split(' (')[0]
+
+            # 获取版本类型（预发行版/正式版）
+            version_type = None
+            if '(' in latest_text:
+                version_type_text = latest_text.split('(')[-1].split(')')[0]
+                if version_type_text in ["预发行版", "Pre-release"]:
+                    version_type = t("me3_page.version_type.prerelease")
+                elif version_type_text in ["正式版", "Release"]:
+                    version_type = t("me3_page.version_type.release")
+
+            # 更新标签文本
+            card.update_prefixes()
+            if current_version == "未安装" or current_version == "Not installed":
+                current_version = t('me3_page.status.not_installed')
+            card.current_version_label.setText(f"{card.current_prefix} {current_version}")
+
+            if latest_version == "检查中..." or latest_version == "Checking...":
+                latest_version = t('me3_page.status.checking')
+            elif latest_version == "获取失败" or latest_version == "Failed":
+                latest_version = t('me3_page.error.get_failed')
+            latest_text = f"{card.latest_prefix} {latest_version}"
+            if version_type:
+                latest_text += f" ({version_type})"
+            card.latest_version_label.setText(latest_text)
+        except Exception as e:
+            print(f"更新版本信息卡片失败: {e}")
+
     def _on_language_changed(self, locale: str):
         """语言切换回调"""
         try:
             # 更新页面标题
-            if hasattr(self, 'title_label'):
-                self.title_label.setText(t("me3_page.page_title"))
+            self.title_label.setText(t("me3_page.page_title"))
 
             # 更新ME3工具区域
-            if hasattr(self, 'me3_section'):
-                self.me3_section.setTitle(t("me3_page.section.me3_tool"))
+            self.me3_section.setTitle(t("me3_page.section.me3_tool"))
 
             # 更新版本类型选择
-            if hasattr(self, 'me3_version_type_label'):
-                self.me3_version_type_label.setText(t("me3_page.label.version_type"))
-            if hasattr(self, 'me3_portable_radio'):
-                self.me3_portable_radio.setText(t("me3_page.type.portable"))
-            if hasattr(self, 'me3_full_radio'):
-                self.me3_full_radio.setText(t("me3_page.type.full_install"))
+            self.me3_version_type_label.setText(t("me3_page.label.version_type"))
+            self.me3_portable_radio.setText(t("me3_page.type.portable"))
+            self.me3_full_radio.setText(t("me3_page.type.full_install"))
 
             # 更新版本信息卡片
-            if hasattr(self, 'me3_version_card'):
-                try:
-                    # 重新获取当前状态并更新显示
-                    current_version = self.me3_version_card.current_version_label.text().split(': ')[-1].split(' (')[0]
-                    latest_version = self.me3_version_card.latest_version_label.text().split(': ')[-1].split(' (')[0]
-
-                    # 更新标签文本
-                    if current_version == "未安装" or current_version == "Not installed":
-                        self.me3_version_card.current_version_label.setText(
-                            f"{t('me3_page.label.current_version')} {t('me3_page.status.not_installed')}"
-                        )
-                    else:
-                        self.me3_version_card.current_version_label.setText(
-                            f"{t('me3_page.label.current_version')} {current_version}"
-                        )
-
-                    if latest_version == "检查中..." or latest_version == "Checking...":
-                        self.me3_version_card.latest_version_label.setText(
-                            f"{t('me3_page.label.latest_version')} {t('me3_page.status.checking')}"
-                        )
-                    elif latest_version == "获取失败" or latest_version == "Failed":
-                        self.me3_version_card.latest_version_label.setText(
-                            f"{t('me3_page.label.latest_version')} {t('me3_page.error.get_failed')}"
-                        )
-                    else:
-                        self.me3_version_card.latest_version_label.setText(
-                            f"{t('me3_page.label.latest_version')} {latest_version}"
-                        )
-                except Exception as e:
-                    print(f"更新版本信息卡片失败: {e}")
+            self._retranslate_version_card(self.me3_version_card)
 
             # 更新按钮文本
-            if hasattr(self, 'me3_check_update_btn'):
-                self.me3_check_update_btn.setText(t("me3_page.button.check_update"))
-            if hasattr(self, 'me3_vcredist_btn'):
-                self.me3_vcredist_btn.setText(t("me3_page.button.fix_runtime"))
-            if hasattr(self, 'me3_cancel_btn'):
-                self.me3_cancel_btn.setText(t("me3_page.button.cancel"))
-            if hasattr(self, 'me3_uninstall_btn'):
-                self.me3_uninstall_btn.setText(t("me3_page.button.uninstall"))
+            self.me3_check_update_btn.setText(t("me3_page.button.check_update"))
+            self.me3_vcredist_btn.setText(t("me3_page.button.fix_runtime"))
+            self.me3_cancel_btn.setText(t("me3_page.button.cancel"))
+            self.me3_uninstall_btn.setText(t("me3_page.button.uninstall"))
 
             # 更新下载按钮文本（根据当前状态）
-            if hasattr(self, 'me3_download_btn') and hasattr(self, 'on_me3_version_type_changed'):
-                try:
-                    # 重新触发版本类型切换处理，更新按钮文本
-                    self.on_me3_version_type_changed()
-                except Exception as e:
-                    print(f"更新下载按钮文本失败: {e}")
+            try:
+                # 重新触发版本类型切换处理，更新按钮文本
+                self.on_me3_version_type_changed()
+            except Exception as e:
+                print(f"更新下载按钮文本失败: {e}")
 
-            # 更新EasyTier工具区域
-            if hasattr(self, 'easytier_section'):
+            # 更新EasyTier工具区域（首次显示前尚未创建）
+            if self.easytier_section is not None:
                 self.easytier_section.setTitle(t("me3_page.easytier_section.title"))
 
-            # 更新EasyTier版本类型选择
-            if hasattr(self, 'easytier_release_radio'):
+                # 更新EasyTier版本类型选择
                 self.easytier_release_radio.setText(t("me3_page.easytier_section.type.release"))
-            if hasattr(self, 'easytier_prerelease_radio'):
                 self.easytier_prerelease_radio.setText(t("me3_page.easytier_section.type.prerelease"))
 
-            # 更新EasyTier按钮文本
-            if hasattr(self, 'easytier_download_btn'):
+                # 更新EasyTier按钮文本
                 self.easytier_download_btn.setText(t("me3_page.easytier_section.button.download"))
-            if hasattr(self, 'easytier_check_btn'):
                 self.easytier_check_btn.setText(t("me3_page.easytier_section.button.check_update"))
 
-            # 更新EasyTier版本信息卡片
-            if hasattr(self, 'easytier_version_card'):
-                try:
-                    # 重新获取当前状态并更新显示
-                    current_version = self.easytier_version_card.current_version_label.text().split(': ')[-1].split(' (')[0]
-                    latest_version = self.easytier_version_card.latest_version_label.text().split(': ')[-1].split(' (')[0]
-
-                    # 获取版本类型
-                    version_type = None
-                    if '(' in self.easytier_version_card.latest_version_label.text():
-                        version_type_text = self.easytier_version_card.latest_version_label.text().split('(')[-1].split(')')[0]
-                        # 判断是预发行版还是正式版
-                        if version_type_text in ["预发行版", "Pre-release"]:
-                            version_type = t("me3_page.version_type.prerelease")
-                        elif version_type_text in ["正式版", "Release"]:
-                            version_type = t("me3_page.version_type.release")
-
-                    # 更新标签文本
-                    if current_version == "未安装" or current_version == "Not installed":
-                        self.easytier_version_card.current_version_label.setText(
-                            f"{t('me3_page.label.current_version')} {t('me3_page.status.not_installed')}"
-                        )
-                    else:
-                        self.easytier_version_card.current_version_label.setText(
-                            f"{t('me3_page.label.current_version')} {current_version}"
-                        )
-
-                    if latest_version == "检查中..." or latest_version == "Checking...":
-                        self.easytier_version_card.latest_version_label.setText(
-                            f"{t('me3_page.label.latest_version')} {t('me3_page.status.checking')}"
-                        )
-                    elif latest_version == "获取失败" or latest_version == "Failed":
-                        self.easytier_version_card.latest_version_label.setText(
-                            f"{t('me3_page.label.latest_version')} {t('me3_page.error.get_failed')}"
-                        )
-                    else:
-                        latest_text = f"{t('me3_page.label.latest_version')} {latest_version}"
-                        if version_type:
-                            latest_text += f" ({version_type})"
-                        self.easytier_version_card.latest_version_label.setText(latest_text)
-                except Exception as e:
-                    print(f"更新Easytier版本信息卡片失败: {e}")
+                # 更新EasyTier版本信息卡片
+                self._retranslate_version_card(self.easytier_version_card)
 
             # 更新OnlineFix工具包区域
-            if hasattr(self, 'onlinefix_section'):
-                self.onlinefix_section.setTitle(t("me3_page.onlinefix_section.title"))
+            self.onlinefix_section.setTitle(t("me3_page.onlinefix_section.title"))
 
             # 更新OnlineFix按钮文本
-            if hasattr(self, 'onlinefix_download_btn'):
-                # 根据当前状态更新按钮文本
-                if self.onlinefix_download_btn.isEnabled():
-                    self.onlinefix_download_btn.setText(t("me3_page.onlinefix_section.button.download"))
-                else:
-                    self.onlinefix_download_btn.setText(t("me3_page.onlinefix_section.button.downloading"))
-            if hasattr(self, 'onlinefix_check_btn'):
-                self.onlinefix_check_btn.setText(t("me3_page.onlinefix_section.button.check_status"))
+            # 根据当前状态更新按钮文本
+            if self.onlinefix_download_btn.isEnabled():
+                self.onlinefix_download_btn.setText(t("me3_page.onlinefix_section.button.download"))
+            else:
+                self.onlinefix_download_btn.setText(t("me3_page.onlinefix_section.button.downloading"))
+            self.onlinefix_check_btn.setText(t("me3_page.onlinefix_section.button.check_status"))
 
             # 更新OnlineFix状态标签和详细信息标签
-            if hasattr(self, 'onlinefix_status_label') and hasattr(self, 'onlinefix_detail_label'):
-                try:
-                    # 获取当前状态文本
-                    current_status = self.onlinefix_status_label.text()
-                    current_detail = self.onlinefix_detail_label.text()
-
-                    # 根据当前状态更新文本
-                    if "检查中" in current_status or "Checking" in current_status:
-                        self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.checking"))
-                    elif "工具包完整" in current_status or "Complete" in current_status:
-                        self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.complete"))
-                    elif "工具包缺失" in current_status or "Missing" in current_status:
-                        self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.missing"))
-                    elif "下载完成" in current_status or "Downloaded" in current_status:
-                        self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.download_complete"))
-                    elif "下载失败" in current_status or "Failed" in current_status:
-                        self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.download_failed"))
-                    elif "正在下载" in current_status or "Downloading" in current_status:
-                        self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.downloading"))
-                    elif "下载启动失败" in current_status or "Start failed" in current_status:
-                        self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.start_failed"))
-                    elif "检查失败" in current_status or "Check failed" in current_status:
-                        self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.check_failed"))
-                    elif "状态检查失败" in current_status or "Status check failed" in current_status:
-                        self.onlinefix_status_label.setText(t("me3_page.onlinefix_section.status.status_check_failed"))
-
-                    # 更新详细信息标签
-                    if "包含" in current_detail or "Includes" in current_detail:
-                        self.onlinefix_detail_label.setText(t("me3_page.onlinefix_section.detail.includes"))
-                    elif "所有必需文件已就绪" in current_detail or "All files ready" in current_detail:
-                        self.onlinefix_detail_label.setText(t("me3_page.onlinefix_section.detail.ready"))
-                    elif "需要下载" in current_detail or "Need to download" in current_detail:
-                        self.onlinefix_detail_label.setText(t("me3_page.onlinefix_section.detail.need_download"))
-                    elif "已安装完成" in current_detail or "installed" in current_detail:
-                        self.onlinefix_detail_label.setText(t("me3_page.onlinefix_section.detail.installed"))
-                    elif "错误" in current_detail or "Error" in current_detail:
-                        # 保留错误消息
-                        pass
-                except Exception as e:
-                    print(f"更新OnlineFix状态标签失败: {e}")
+            try:
+                # 获取当前状态文本
+                current_status = self.onlinefix_status_label.text()
+                current_detail = self.onlinefix_detail_label.text()
+
+                # 根据当前状态更新文本（一次正则扫描识别状态）
+                match = _ONLINEFIX_STATUS_RE.search(current_status)
+                if match:
+                    self.onlinefix_status_label.setText(t(f"me3_page.onlinefix_section.status.{match.lastgroup}"))
+
+                # 更新详细信息标签（错误消息保留原文）
+                match = _ONLINEFIX_DETAIL_RE.search(current_detail)
+                if match and match.lastgroup != 'error':
+                    self.onlinefix_detail_label.setText(t(f"me3_page.onlinefix_section.detail.{match.lastgroup}"))
+            except Exception as e:
+                print(f"更新OnlineFix状态标签失败: {e}")
         except Exception as e:
             print(f"语言切换回调失败: {e}")
 
@@ -3,69 +3,408 @@
 负责ME3工具的下载和版本管理
 """
 import os
+import re
+import sys
 import json
+import shutil
 import zipfile
+import subprocess
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from pathlib import Path
+from functools import lru_cache
+from urllib.parse import urlsplit
 from typing import Optional, List, Dict
 from PySide6.QtCore import QObject, Signal, QThread
 
 
-class DownloadWorker(QThread):
-    """下载工作线程"""
-    progress = Signal(int)  # 下载进度
-    finished = Signal(bool, str)  # 完成信号(成功, 消息)
+# 已知镜像的显示名称（按主机名查表）
+_MIRROR_DISPLAY = {
+    "gh-proxy.com": "gh-proxy.com",
+    "ghproxy.net": "ghproxy.net",
+    "ghfast.top": "ghfast.top",
+    "github.com": "GitHub官方",
+}
 
-    def __init__(self, url: str, save_path: str):
-        super().__init__()
+
+@lru_cache(maxsize=64)
+def mirror_display_name(mirror_url: str) -> str:
+    """获取镜像显示名称（镜像列表很小，结果缓存后重复查询无需再解析URL）"""
+    if not mirror_url:
+        return "GitHub官方"
+    host = urlsplit(mirror_url).hostname or ""
+    fallback = mirror_url.removeprefix("https://").removeprefix("http://").rstrip("/")
+    return _MIRROR_DISPLAY.get(host, fallback)
+
+
+# 所有下载共用的分段下载线程池（限制同时进行的分段连接总数）
+_segment_executor = None
+_segment_executor_lock = threading.Lock()
+
+
+def get_segment_executor(max_workers: int) -> ThreadPoolExecutor:
+    """获取共享的分段下载线程池"""
+    global _segment_executor
+    with _segment_executor_lock:
+        if _segment_executor is None:
+            _segment_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="segment")
+        return _segment_executor
+
+
+# 发行版信息中实际用到的字段（作者、更新说明、上传者等不缓存）
+_RELEASE_FIELDS = ('tag_name', 'name', 'prerelease', 'published_at')
+_ASSET_FIELDS = ('name', 'browser_download_url', 'size')
+
+
+def slim_release_data(data):
+    """只保留用到的发行版字段（支持单个发行版或发行版列表），减小缓存文件和读写开销"""
+    if isinstance(data, list):
+        return [slim_release_data(release) for release in data]
+    if not isinstance(data, dict):
+        return data
+    slim = {key: data[key] for key in _RELEASE_FIELDS if key in data}
+    slim['assets'] = [
+        {key: asset[key] for key in _ASSET_FIELDS if key in asset}
+        for asset in data.get('assets', [])
+    ]
+    return slim
+
+
+# 共享HTTP会话（复用连接，避免每次请求重新握手）
+_http_session = None
+
+
+def get_http_session() -> requests.Session:
+    """获取共享的HTTP会话"""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+class FileDownloader:
+    """文件下载器（服务器支持Range时分段并行下载），在调用方线程中同步执行"""
+
+    SEGMENT_SIZE = 2 * 1024 * 1024  # 分段大小，空闲线程会继续领取剩余分段
+    SEGMENT_WORKERS = 6  # 所有下载共用的并行连接数（同Qt网络模块每主机6个连接）
+    MIN_SEGMENTED_SIZE = 4 * 1024 * 1024  # 小文件直接单连接下载
+    CHUNK_SIZE = 1024 * 1024  # 每次读取/写入1MiB，减少系统调用次数
+
+    def __init__(self, url: Optional[str], save_path: str, url_resolver=None, resumable: bool = False,
+                 progress_callback=None):
         self.url = url
         self.save_path = save_path
+        self.url_resolver = url_resolver  # 在下载线程中解析下载地址（获取版本信息、选择镜像）
+        self.progress_callback = progress_callback  # 进度百分比变化时调用
+        # 可续传时先下载到.part文件并记录已完成的分段，取消或失败后保留，下次下载同一文件时跳过
+        self.resumable = resumable
+        self._download_path = f"{save_path}.part" if resumable else save_path
+        self._state_path = f"{save_path}.part.json"
+        self._state_lock = threading.Lock()
+        self._resume_key = None  # 续传记录的校验信息（下载地址、ETag、Last-Modified）
         self._is_cancelled = False
+        self._progress_lock = threading.Lock()
+        self._downloaded = 0
+        self._last_progress = -1
+        self._responses = set()  # 正在读取的响应，取消时关闭以立即中断阻塞的读取
+        self._responses_lock = threading.Lock()
+        self._futures = []  # 提交到共享线程池的分段任务，取消时撤下尚未开始的任务
 
     def cancel(self):
-        """取消下载"""
-        self._is_cancelled = True
-        self.quit()
-        self.wait()
+        """取消下载（关闭正在读取的连接，不必等待当前数据块读完或超时）
 
-    def run(self):
+        不在此等待线程结束：解析下载地址（获取版本信息、测速、探测）期间无法中断，
+        等待会阻塞界面线程；download在每个阶段结束后检查取消标记并直接返回
+        """
+        self._is_cancelled = True
+        # 共享线程池可能正忙于其他下载，排队中的分段直接撤下，避免等待它们轮到执行
+        with self._responses_lock:
+            futures = list(self._futures)
+            responses = list(self._responses)
+        for future in futures:
+            future.cancel()
+        for response in responses:
+            try:
+                response.close()
+            except Exception:
+                pass
+
+    def _open_stream(self, headers=None):
+        """发起流式GET请求并登记响应，调用方读取完毕后需调用_close_stream"""
+        response = get_http_session().get(self.url, headers=headers, stream=True, timeout=30)
+        with self._responses_lock:
+            self._responses.add(response)
+        if self._is_cancelled:
+            # 登记前已取消，cancel未能关闭此响应
+            self._close_stream(response)
+        return response
+
+    def _close_stream(self, response):
+        """注销并关闭响应"""
+        with self._responses_lock:
+            self._responses.discard(response)
+        response.close()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
+    def download(self) -> bool:
+        """执行下载，完成返回True，被取消返回False，失败时抛出异常"""
         try:
             if self._is_cancelled:
-                return
+                return False
 
             # 确保父目录存在
-            from pathlib import Path
             save_path = Path(self.save_path)
             save_path.parent.mkdir(parents=True, exist_ok=True)
 
-            response = requests.get(self.url, stream=True, timeout=30)
+            if self.url_resolver:
+                self.url = self.url_resolver()
+                if self._is_cancelled:
+                    return False
+                if not self.url:
+                    raise RuntimeError("无法获取下载地址")
+
+            total_size = self._probe_segmented_size()
+            if self._is_cancelled:
+                return False
+            downloaded = False
+            if total_size:
+                try:
+                    self._download_segmented(total_size)
+                    downloaded = True
+                except Exception as e:
+                    if self._is_cancelled:
+                        self._remove_partial_file()
+                        return False
+                    print(f"分段下载失败，改用单连接下载: {e}")
+
+            if not downloaded:
+                self._download_single()
+
+            if self._is_cancelled:
+                self._remove_partial_file()
+                return False
+
+            if self.resumable:
+                os.replace(self._download_path, self.save_path)
+                self._remove_resume_state()
+
+            return True
+        except Exception:
+            # 取消时连接被关闭，读取会抛出异常
+            if self._is_cancelled:
+                self._remove_partial_file()
+                return False
+            raise
+
+    def _remove_partial_file(self):
+        """删除部分下载的文件（可续传的下载保留，供下次继续）"""
+        if self.resumable:
+            return
+        try:
+            os.remove(self.save_path)
+        except:
+            pass
+
+    def _load_resume_state(self, total_size: int) -> set:
+        """读取已完成分段的起始位置，下载地址、ETag/Last-Modified或文件大小不一致时视为无效"""
+        if not self.resumable or not self._resume_key:
+            return set()
+        try:
+            with open(self._state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if (state.get('key') == self._resume_key and state.get('total_size') == total_size
+                    and os.path.getsize(self._download_path) == total_size):
+                return set(state.get('done', []))
+        except (OSError, ValueError):
+            pass
+        return set()
+
+    def _save_resume_state(self, total_size: int, done: set):
+        """记录已完成的分段（调用方需持有_state_lock）"""
+        try:
+            with open(self._state_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': self._resume_key, 'total_size': total_size, 'done': sorted(done)}, f)
+        except OSError as e:
+            print(f"保存续传进度失败: {e}")
+
+    def _remove_resume_state(self):
+        """删除续传进度记录"""
+        try:
+            os.remove(self._state_path)
+        except OSError:
+            pass
+
+    def _probe_segmented_size(self) -> int:
+        """检测服务器是否支持分段下载，支持时返回文件大小，否则返回0"""
+        try:
+            response = get_http_session().head(self.url, timeout=10, allow_redirects=True)
+            if response.status_code >= 400:
+                return 0
+            if response.headers.get('accept-ranges', '').lower() != 'bytes':
+                return 0
+            total_size = int(response.headers.get('content-length', 0))
+            if total_size < self.MIN_SEGMENTED_SIZE:
+                return 0
+            # 续传记录按重定向前的地址和文件版本标识区分（重定向后的签名地址每次都会变化），
+            # 服务器不提供ETag/Last-Modified时无法确认文件未变，不续传
+            etag = response.headers.get('etag')
+            last_modified = response.headers.get('last-modified')
+            if etag or last_modified:
+                self._resume_key = {'url': self.url, 'etag': etag, 'last_modified': last_modified}
+            # 使用重定向后的地址，避免每个分段都重复跳转
+            self.url = response.url
+            return total_size
+        except Exception:
+            return 0
+
+    def _download_single(self):
+        """单连接下载"""
+        self._downloaded = 0
+        self._last_progress = -1
+
+        # 单连接下载从头写入，之前的分段记录失效
+        self._remove_resume_state()
+        response = self._open_stream()
+        try:
             response.raise_for_status()
 
             total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
 
-            with open(self.save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            with open(self._download_path, 'wb') as f:
+                if total_size > 0:
+                    # 预分配文件大小
+                    f.truncate(total_size)
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
                     if self._is_cancelled:
-                        # 删除部分下载的文件
-                        try:
-                            os.remove(self.save_path)
-                        except:
-                            pass
                         return
-
                     if chunk:
                         f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            progress = int((downloaded / total_size) * 100)
-                            self.progress.emit(progress)
+                        self._add_progress(len(chunk), total_size)
+        finally:
+            self._close_stream(response)
+
+    def _download_segmented(self, total_size: int):
+        """按Range分段并行下载到预分配的文件"""
+        self._last_progress = -1
+
+        segments = [(start, min(start + self.SEGMENT_SIZE, total_size) - 1)
+                    for start in range(0, total_size, self.SEGMENT_SIZE)]
+
+        done = self._load_resume_state(total_size)
+        if done:
+            # 续传：跳过已完成的分段，进度从已下载的部分开始
+            segments = [segment for segment in segments if segment[0] not in done]
+            self._downloaded = total_size - sum(end - start + 1 for start, end in segments)
+            print(f"继续之前的下载，剩余 {len(segments)} 个分段")
+        else:
+            self._downloaded = 0
+            with open(self._download_path, 'wb') as f:
+                f.truncate(total_size)
+            if self.resumable:
+                with self._state_lock:
+                    self._save_resume_state(total_size, done)
+
+        failed = threading.Event()
+
+        def fetch_segment(segment):
+            if self._is_cancelled or failed.is_set():
+                return
+            start, end = segment
+            response = self._open_stream({'Range': f'bytes={start}-{end}'})
+            try:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise RuntimeError("服务器未返回分段内容")
+
+                written = 0
+                with open(self._download_path, 'r+b') as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                        if self._is_cancelled or failed.is_set():
+                            return
+                        if chunk:
+                            f.write(chunk)
+                            written += len(chunk)
+                            self._add_progress(len(chunk), total_size)
+            finally:
+                self._close_stream(response)
+
+            # 连接被关闭时读取可能提前正常结束，只有完整写入的分段才记为完成
+            if self._is_cancelled or failed.is_set():
+                return
+            if written != end - start + 1:
+                raise RuntimeError(f"分段数据不完整: {written}/{end - start + 1}")
+
+            if self.resumable:
+                with self._state_lock:
+                    done.add(start)
+                    self._save_resume_state(total_size, done)
 
-            if not self._is_cancelled:
+        executor = get_segment_executor(self.SEGMENT_WORKERS)
+        with self._responses_lock:
+            if self._is_cancelled:
+                return
+            futures = [executor.submit(fetch_segment, segment) for segment in segments]
+            self._futures = futures
+        try:
+            # 逐个取结果，任一分段失败或被取消时抛出异常
+            for future in futures:
+                future.result()
+        except Exception:
+            # 停止其余分段，等正在写入的分段退出后再交给调用方回退
+            # （取消时正在读取的连接已被关闭，运行中的分段会很快退出）
+            failed.set()
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            raise
+
+    def _add_progress(self, size: int, total_size: int):
+        """累计下载量并在百分比变化时发送进度"""
+        if total_size <= 0:
+            return
+        with self._progress_lock:
+            self._downloaded += size
+            progress = int((self._downloaded / total_size) * 100)
+            if progress == self._last_progress:
+                return
+            self._last_progress = progress
+        if self.progress_callback:
+            self.progress_callback(progress)
+
+
+class DownloadWorker(QThread):
+    """下载工作线程（在独立线程中运行FileDownloader）"""
+    progress = Signal(int)  # 下载进度
+    finished = Signal(bool, str)  # 完成信号(成功, 消息)
+
+    def __init__(self, url: Optional[str], save_path: str, url_resolver=None, resumable: bool = False):
+        super().__init__()
+        self.release_info = None  # 实际下载的发行版信息（由url_resolver填写），完成后按其记录版本
+        self._downloader = FileDownloader(url, save_path, url_resolver=url_resolver, resumable=resumable,
+                                          progress_callback=self.progress.emit)
+
+    def cancel(self):
+        """取消下载（不等待线程结束，被取消的下载不发送完成信号）"""
+        self._downloader.cancel()
+
+    def run(self):
+        try:
+            if self._downloader.download():
                 self.finished.emit(True, "下载完成")
         except Exception as e:
-            if not self._is_cancelled:
+            if not self._downloader.is_cancelled:
                 self.finished.emit(False, f"下载失败: {str(e)}")
 
 
@@ -78,6 +417,12 @@ class DownloadManager(QObject):
     onlinefix_download_finished = Signal(bool, str)  # OnlineFix下载完成信号(成功, 消息)
     onlinefix_download_progress = Signal(int)  # OnlineFix下载进度信号(进度百分比)
 
+    # GitHub发行版API地址
+    ME3_RELEASE_API = "https://api.github.com/repos/garyttierney/me3/releases/latest"
+    EASYTIER_RELEASE_API = "https://api.github.com/repos/EasyTier/EasyTier/releases/latest"
+    # 只取最新一个发行版（可能是预发行版），避免下载完整列表
+    EASYTIER_PRERELEASE_API = "https://api.github.com/repos/EasyTier/EasyTier/releases?per_page=1"
+
     # GitHub加速镜像地址
     DEFAULT_PROXY_URLS = [
         "https://gh-proxy.com/",
@@ -96,6 +441,10 @@ class DownloadManager(QObject):
         # self.erm_version_file = self.erm_dir / "version.json"  # ERModsMerger已移除
         self.esr_version_file = self.esr_dir / "version.json"  # EasyTier版本文件
         self.config_file = self.me3_dir / "mirrors.json"
+        self.mirror_stats_file = self.me3_dir / "mirror_stats.json"  # 镜像历史延迟
+        self.release_tags_file = self.me3_dir / "release_tags.json"  # 最新版本号持久缓存
+        self.release_cache_file = self.me3_dir / "release_cache.json"  # 发行版信息持久缓存
+        self.status_snapshot_file = self.me3_dir / "tool_status_cache.json"  # 上次检测到的工具状态
 
         # 确保目录存在
         self.me3_dir.mkdir(exist_ok=True)
@@ -105,33 +454,37 @@ class DownloadManager(QObject):
 
         # 加载镜像配置
         self.PROXY_URLS = self.load_mirrors()
-
-        # EasyTier版本信息缓存
-        self._easytier_cache = {
-            'release': {'data': None, 'timestamp': None},
-            'prerelease': {'data': None, 'timestamp': None}
+        self._mirror_stats = self.load_mirror_stats()
+        self._mirror_stats_lock = threading.Lock()
+
+        self._cache_duration = timedelta(minutes=10)  # 发行版信息缓存10分钟
+        # 最佳下载源缓存 {主机: (下载源, 过期时间)}，检查更新后预先测速
+        self._best_source_cache = {}
+
+        # 本地版本查询缓存 {key: (文件签名, 结果)}
+        self._stat_cache = {}
+        # ME3 version.json解析结果 (文件签名, 内容)
+        self._version_info_cache = None
+        # 各版本查询依赖的文件，任一文件变化即重新查询
+        self._version_sources = {
+            'me3': (self.me3_dir / "bin" / "me3.exe", self.version_file),
+            'easytier': (self.esr_dir / "easytier-core.exe", self.esr_version_file),
         }
-        self._cache_duration = timedelta(minutes=5)  # 缓存5分钟
+        # 安装版检测缓存 {key: (结果, 过期时间)}
+        self._probe_cache = {}
+        self._probe_lock = threading.Lock()
 
-    def _is_cache_valid(self, cache_type: str) -> bool:
-        """检查缓存是否有效"""
-        cache = self._easytier_cache.get(cache_type)
-        if not cache or not cache['timestamp'] or not cache['data']:
-            return False
-        return datetime.now() - cache['timestamp'] < self._cache_duration
+        # 发行版信息缓存（按API地址，附带ETag/Last-Modified用于条件请求，跨启动保留）
+        self._release_cache = self.load_release_cache()
+        self._release_cache_lock = threading.Lock()
 
-    def _get_cached_data(self, cache_type: str):
-        """获取缓存数据"""
-        if self._is_cache_valid(cache_type):
-            return self._easytier_cache[cache_type]['data']
-        return None
+        # 最新版本号持久缓存 {key: {'tag_name': ..., 'fetched_at': ...}}
+        self._release_tags = self.load_release_tags()
+        self._release_tags_lock = threading.Lock()
 
-    def _set_cache_data(self, cache_type: str, data):
-        """设置缓存数据"""
-        self._easytier_cache[cache_type] = {
-            'data': data,
-            'timestamp': datetime.now()
-        }
+        # 下载线程（开始下载时创建，页面据此连接进度信号）
+        self.easytier_download_worker = None
+        self.onlinefix_download_worker = None
 
     def load_mirrors(self) -> list:
         """加载镜像配置"""
@@ -170,23 +523,192 @@ class DownloadManager(QObject):
     def get_mirrors(self) -> list:
         """获取当前镜像列表"""
         return self.PROXY_URLS.copy()
-    
-    def get_latest_release_info(self) -> Optional[Dict]:
-        """获取最新版本信息"""
-        api_url = "https://api.github.com/repos/garyttierney/me3/releases/latest"
-        
-        for proxy in [""] + self.PROXY_URLS:
+
+    # 延迟平滑系数（指数加权移动平均）
+    MIRROR_LATENCY_ALPHA = 0.3
+
+    def load_mirror_stats(self) -> dict:
+        """加载镜像历史延迟（毫秒）"""
+        try:
+            if self.mirror_stats_file.exists():
+                with open(self.mirror_stats_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"加载镜像延迟记录失败: {e}")
+        return {}
+
+    def record_mirror_latency(self, mirror_url: str, latency_ms: float):
+        """记录镜像延迟并保存到磁盘"""
+        with self._mirror_stats_lock:
+            previous = self._mirror_stats.get(mirror_url)
+            if previous is None:
+                self._mirror_stats[mirror_url] = round(latency_ms, 1)
+            else:
+                alpha = self.MIRROR_LATENCY_ALPHA
+                self._mirror_stats[mirror_url] = round(alpha * latency_ms + (1 - alpha) * previous, 1)
             try:
-                url = f"{proxy}{api_url}" if proxy else api_url
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-                return response.json()
+                with open(self.mirror_stats_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._mirror_stats, f, indent=2, ensure_ascii=False)
             except Exception as e:
-                print(f"获取版本信息失败 ({proxy or 'direct'}): {e}")
-                continue
-        
+                print(f"保存镜像延迟记录失败: {e}")
+
+    def get_mirrors_by_latency(self) -> list:
+        """按历史延迟排序的镜像列表（无记录的保持原顺序排在后面）"""
+        stats = self._mirror_stats
+        return sorted(self.PROXY_URLS, key=lambda m: stats.get(m, float('inf')))
+    
+    def get_latest_release_info(self, use_cache: bool = True) -> Optional[Dict]:
+        """获取最新版本信息（带缓存，use_cache为False时跳过有效期直接请求）"""
+        return self._get_cached_release(self.ME3_RELEASE_API, use_cache)
+
+    def load_release_cache(self) -> dict:
+        """加载持久化的发行版信息缓存"""
+        try:
+            if self.release_cache_file.exists():
+                with open(self.release_cache_file, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                # 兼容旧版本保存的完整发行版信息
+                for entry in cache.values():
+                    entry['data'] = slim_release_data(entry.get('data'))
+                return cache
+        except Exception as e:
+            print(f"加载发行版信息缓存失败: {e}")
+        return {}
+
+    def _save_release_cache(self):
+        """保存发行版信息缓存（调用方需持有锁）"""
+        try:
+            with open(self.release_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._release_cache, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"保存发行版信息缓存失败: {e}")
+
+    def _get_cached_release(self, api_url: str, use_cache: bool = True) -> Optional[Dict]:
+        """获取发行版信息，缓存有效期内直接返回，过期或use_cache为False时发送条件请求"""
+        cache = self._release_cache.get(api_url)
+        if use_cache and cache and time.time() - cache.get('fetched_at', 0) < self._cache_duration.total_seconds():
+            return cache['data']
+
+        headers = {}
+        if cache:
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+
+        timeout = 10
+
+        def fetch(proxy):
+            url = f"{proxy}{api_url}" if proxy else api_url
+            start = time.perf_counter()
+            try:
+                response = get_http_session().get(url, headers=headers, timeout=timeout)
+                if response.status_code != 304 or not cache:
+                    response.raise_for_status()
+            except Exception:
+                if proxy:
+                    # 失败按超时计入，降低下次的排序
+                    self.record_mirror_latency(proxy, timeout * 1000)
+                raise
+            if proxy:
+                self.record_mirror_latency(proxy, (time.perf_counter() - start) * 1000)
+            return response
+
+        response = None
+        try:
+            response = fetch("")
+        except Exception as e:
+            print(f"获取版本信息失败 (direct): {e}")
+
+        if response is None:
+            # 直连失败时所有镜像并行请求，取最先成功者，总耗时取决于最快的镜像
+            mirrors = self.get_mirrors_by_latency()
+            if not mirrors:
+                return None
+            executor = ThreadPoolExecutor(max_workers=len(mirrors))
+            try:
+                futures = {executor.submit(fetch, proxy): proxy for proxy in mirrors}
+                for future in as_completed(futures):
+                    try:
+                        response = future.result()
+                        break
+                    except Exception as e:
+                        print(f"获取版本信息失败 ({futures[future]}): {e}")
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if response is None:
+                return None
+
+        if response.status_code == 304:
+            # 未修改，续期缓存
+            with self._release_cache_lock:
+                cache['fetched_at'] = time.time()
+                self._save_release_cache()
+            return cache['data']
+        try:
+            data = slim_release_data(response.json())
+        except ValueError as e:
+            print(f"解析版本信息失败: {e}")
+            return None
+        with self._release_cache_lock:
+            self._release_cache[api_url] = {
+                'data': data,
+                'fetched_at': time.time(),
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+            self._save_release_cache()
+        return data
+
+    # 最新版本号持久缓存有效期（秒），发行版通常以天为单位更新
+    RELEASE_TAG_TTL = 6 * 3600
+
+    def load_release_tags(self) -> dict:
+        """加载持久化的最新版本号"""
+        try:
+            if self.release_tags_file.exists():
+                with open(self.release_tags_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"加载版本号缓存失败: {e}")
+        return {}
+
+    def _save_release_tags(self):
+        """保存最新版本号缓存（调用方需持有锁）"""
+        try:
+            with open(self.release_tags_file, 'w', encoding='utf-8') as f:
+                json.dump(self._release_tags, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"保存版本号缓存失败: {e}")
+
+    def get_cached_release_tag(self, key: str) -> Optional[str]:
+        """获取未过期的最新版本号，过期或不存在时返回None"""
+        entry = self._release_tags.get(key)
+        if entry and time.time() - entry.get('fetched_at', 0) < self.RELEASE_TAG_TTL:
+            return entry.get('tag_name')
         return None
+
+    def save_release_tag(self, key: str, tag_name: str):
+        """记录最新版本号并保存到磁盘"""
+        with self._release_tags_lock:
+            self._release_tags[key] = {'tag_name': tag_name, 'fetched_at': time.time()}
+            self._save_release_tags()
+
+    def invalidate_release_tag(self, key: str):
+        """清除指定工具的版本号缓存（手动检查更新时调用）
+
+        发行版信息缓存不受影响，需要跳过时在获取时传入use_cache=False
+        """
+        with self._release_tags_lock:
+            if self._release_tags.pop(key, None) is not None:
+                self._save_release_tags()
     
+    def prefetch_download_source(self, release_info: Dict):
+        """预先测速ME3的下载源（检查更新后在后台调用），同时预热到下载主机的连接"""
+        download_url = self.get_download_url(release_info)
+        if download_url:
+            self.get_best_download_source(download_url)
+
     def get_download_url(self, release_info: Dict) -> Optional[str]:
         """获取Windows版本下载链接"""
         try:
@@ -209,15 +731,69 @@ class DownloadManager(QObject):
             print(f"解析安装程序下载链接失败: {e}")
             return None
     
+    def _file_signature(self, *paths) -> tuple:
+        """文件签名（修改时间、大小、inode），文件不存在时为None"""
+        signature = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                # 替换安装时新文件的修改时间可能与旧文件相同，同时比较大小和inode
+                signature.append((st.st_mtime_ns, st.st_size, st.st_ino))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _get_stat_cached(self, key: str, paths: tuple, loader):
+        """文件未变化时直接返回上次结果，避免重复执行版本查询进程"""
+        signature = self._file_signature(*paths)
+        cached = self._stat_cache.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        value = loader()
+        self._stat_cache[key] = (signature, value)
+        return value
+
+    def is_status_cache_warm(self, include_easytier: bool = True) -> bool:
+        """本地状态查询是否都能命中缓存（命中时不会启动版本查询进程）"""
+        keys = ['me3', 'easytier'] if include_easytier else ['me3']
+        for key in keys:
+            cached = self._stat_cache.get(key)
+            if not cached or cached[0] != self._file_signature(*self._version_sources[key]):
+                return False
+        with self._probe_lock:
+            cached = self._probe_cache.get('me3_full')
+            return bool(cached and cached[1] > time.monotonic())
+
+    def load_status_snapshot(self) -> dict:
+        """加载上次保存的工具状态（用于冷启动时先行显示），失败时返回空字典"""
+        try:
+            if self.status_snapshot_file.exists():
+                with open(self.status_snapshot_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    if isinstance(data, dict):
+                        return data
+        except Exception as e:
+            print(f"加载工具状态缓存失败: {e}")
+        return {}
+
+    def save_status_snapshot(self, status_info: dict):
+        """保存最近一次检测到的工具状态"""
+        try:
+            with open(self.status_snapshot_file, 'w', encoding='utf-8') as f:
+                json.dump(status_info, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"保存工具状态缓存失败: {e}")
+
     def get_current_version(self) -> Optional[str]:
-        """获取当前已安装的便携版版本"""
+        """获取当前已安装的便携版版本（按文件修改时间缓存）"""
+        return self._get_stat_cached('me3', self._version_sources['me3'], self._read_current_version)
+
+    def _read_current_version(self) -> Optional[str]:
+        """读取当前已安装的便携版版本"""
         try:
-            import subprocess
-            import re
             # 执行便携版me3.exe获取真实版本
             me3_exe_path = self.me3_dir / "bin" / "me3.exe"
             if me3_exe_path.exists():
-                import sys
                 creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
                 result = subprocess.run([str(me3_exe_path), '-V'],
                                       capture_output=True, text=True, timeout=5,
@@ -231,14 +807,43 @@ class DownloadManager(QObject):
                         return f"v{version_match.group(1)}"
 
             # 如果执行失败，回退到读取version.json（兼容性）
-            if self.version_file.exists():
-                with open(self.version_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('version')
-            return None
+            return self.load_version_info().get('version')
         except Exception as e:
             print(f"获取便携版版本失败: {e}")
             return None
+
+    def load_version_info(self) -> dict:
+        """读取ME3的version.json（按文件签名缓存解析结果），返回副本，不存在或损坏时返回空字典"""
+        signature = self._file_signature(self.version_file)
+        cached = self._version_info_cache
+        if cached is None or cached[0] != signature:
+            version_info = {}
+            try:
+                if self.version_file.exists():
+                    with open(self.version_file, 'r', encoding='utf-8') as f:
+                        version_info = json.load(f)
+            except Exception as e:
+                print(f"读取版本信息失败: {e}")
+            cached = (signature, version_info)
+            self._version_info_cache = cached
+        return dict(cached[1])
+
+    def update_version_info(self, updates: Dict = None, remove: tuple = ()):
+        """合并更新version.json中的字段（remove中的字段会被删除）"""
+        version_info = self.load_version_info()
+        for key in remove:
+            version_info.pop(key, None)
+        if updates:
+            version_info.update(updates)
+        self._write_version_info(version_info)
+
+    def _write_version_info(self, version_info: Dict):
+        """先写临时文件再替换，写入中途退出也不会留下损坏的version.json"""
+        temp_file = self.version_file.with_suffix('.json.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(version_info, f, indent=2, ensure_ascii=False)
+        os.replace(temp_file, self.version_file)
+        self._version_info_cache = (self._file_signature(self.version_file), dict(version_info))
     
     def save_version_info(self, version: str, release_info: Dict):
         """保存版本信息"""
@@ -249,9 +854,7 @@ class DownloadManager(QObject):
                 'published_at': release_info.get('published_at'),
                 'download_url': self.get_download_url(release_info)
             }
-            
-            with open(self.version_file, 'w', encoding='utf-8') as f:
-                json.dump(version_data, f, indent=2, ensure_ascii=False)
+            self._write_version_info(version_data)
         except Exception as e:
             print(f"保存版本信息失败: {e}")
     
@@ -278,37 +881,49 @@ class DownloadManager(QObject):
             print(f"解压失败: {e}")
             return False
     
-    def download_me3(self, mirror_url: str = None) -> DownloadWorker:
-        """下载ME3工具"""
-        release_info = self.get_latest_release_info()
-        if not release_info:
-            return None
+    def download_file(self, url: str, save_path, progress_callback=None):
+        """在当前线程中同步下载文件（供线程池任务使用），失败时抛出异常
 
-        download_url = self.get_download_url(release_info)
-        if not download_url:
-            return None
+        Args:
+            progress_callback: 进度百分比变化时调用（在下载线程中调用）
+        """
+        FileDownloader(url, str(save_path), progress_callback=progress_callback).download()
 
-        # 智能选择镜像或使用指定镜像
-        if mirror_url:
-            # 使用指定的镜像
-            proxy = mirror_url
-        else:
-            # 智能选择最佳下载源
-            proxy = self.get_best_download_source(download_url)
+    def download_me3(self, mirror_url: str = None, release_info: Dict = None) -> DownloadWorker:
+        """下载ME3工具（版本信息获取和镜像选择在下载线程中进行）
+
+        Args:
+            release_info: 检查更新时已获取的发行版信息，提供时不再重复请求
+        """
+        known_release_info = release_info
+
+        def resolve_url():
+            release_info = known_release_info or self.get_latest_release_info()
+            if not release_info:
+                return None
+
+            download_url = self.get_download_url(release_info)
+            if not download_url:
+                return None
+
+            # 智能选择镜像或使用指定镜像
+            proxy = mirror_url if mirror_url else self.get_best_download_source(download_url)
+            worker.release_info = release_info
+            return f"{proxy}{download_url}" if proxy else download_url
 
         try:
-            url = f"{proxy}{download_url}" if proxy else download_url
             zip_path = self.me3_dir / "me3-windows-amd64.zip"
 
             # 如果文件已存在，先删除
             if zip_path.exists():
                 zip_path.unlink()
 
-            worker = DownloadWorker(url, str(zip_path))
+            worker = DownloadWorker(None, str(zip_path), url_resolver=resolve_url)
 
             def on_finished(success, message):
                 if success:
                     if self.extract_me3(str(zip_path)):
+                        release_info = worker.release_info
                         self.save_version_info(release_info['tag_name'], release_info)
                         # 不要重复发送信号，让调用者处理
                     else:
@@ -319,31 +934,32 @@ class DownloadManager(QObject):
             return worker
 
         except Exception as e:
-            mirror_name = self._get_mirror_display_name(proxy)
-            print(f"创建ME3下载任务失败 ({mirror_name}): {e}")
+            print(f"创建ME3下载任务失败: {e}")
             return None
 
-    def download_me3_installer(self, mirror_url: str = None) -> DownloadWorker:
-        """下载ME3安装程序"""
-        release_info = self.get_latest_release_info()
-        if not release_info:
-            return None
+    def download_me3_installer(self, mirror_url: str = None, release_info: Dict = None) -> DownloadWorker:
+        """下载ME3安装程序（版本信息获取和镜像选择在下载线程中进行）
 
-        download_url = self.get_installer_download_url(release_info)
-        if not download_url:
-            return None
+        Args:
+            release_info: 检查更新时已获取的发行版信息，提供时不再重复请求
+        """
+        known_release_info = release_info
 
-        # 智能选择镜像或使用指定镜像
-        if mirror_url:
-            # 使用指定的镜像
-            proxy = mirror_url
-        else:
-            # 智能选择最佳下载源
-            proxy = self.get_best_download_source(download_url)
+        def resolve_url():
+            release_info = known_release_info or self.get_latest_release_info()
+            if not release_info:
+                return None
 
-        try:
-            url = f"{proxy}{download_url}" if proxy else download_url
+            download_url = self.get_installer_download_url(release_info)
+            if not download_url:
+                return None
+
+            # 智能选择镜像或使用指定镜像
+            proxy = mirror_url if mirror_url else self.get_best_download_source(download_url)
+            worker.release_info = release_info
+            return f"{proxy}{download_url}" if proxy else download_url
 
+        try:
             # 保存到me3p目录
             installer_path = self.me3_dir / "me3_installer.exe"
 
@@ -351,7 +967,8 @@ class DownloadManager(QObject):
             if installer_path.exists():
                 installer_path.unlink()
 
-            worker = DownloadWorker(url, str(installer_path))
+            # 可续传：取消或失败后已下载的分段保留，下次下载时只补齐剩余部分
+            worker = DownloadWorker(None, str(installer_path), url_resolver=resolve_url, resumable=True)
 
             def on_finished(success, message):
                 if success:
@@ -363,8 +980,7 @@ class DownloadManager(QObject):
             return worker
 
         except Exception as e:
-            mirror_name = self._get_mirror_display_name(proxy)
-            print(f"创建ME3安装程序下载任务失败 ({mirror_name}): {e}")
+            print(f"创建ME3安装程序下载任务失败: {e}")
             return None
 
     def is_me3_installed(self) -> bool:
@@ -378,7 +994,6 @@ class DownloadManager(QObject):
 
     def _get_system_env(self):
         """获取系统环境变量（排除虚拟环境）"""
-        import os
         env = os.environ.copy()
 
         # 检测是否在虚拟环境中
@@ -422,27 +1037,50 @@ class DownloadManager(QObject):
 
         return env
 
-    def is_me3_full_installed(self) -> bool:
-        """检查ME3完整安装版是否已安装"""
+    # 安装版检测结果缓存时间（秒）
+    INSTALL_PROBE_TTL = 30
+
+    def _probe_me3_full(self) -> tuple:
+        """运行me3 -V检测完整安装版，返回(是否安装, 版本号)，结果短时间缓存"""
+        now = time.monotonic()
+        with self._probe_lock:
+            cached = self._probe_cache.get('me3_full')
+            if cached and cached[1] > now:
+                return cached[0]
+
+        value = (False, None)
         try:
-            import subprocess
             # 使用系统环境变量运行me3 -V命令检测
             system_env = self._get_system_env()
-            import sys
             creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
             result = subprocess.run(['me3', '-V'],
                                   capture_output=True, text=True, timeout=5,
                                   env=system_env, creationflags=creation_flags)
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
-            return False
+            if result.returncode == 0:
+                # 解析版本输出，支持 "me3 v0.8.1" 或 "0.8.1" 格式
+                version_match = re.search(r'v?(\d+\.\d+\.\d+)', result.stdout.strip())
+                # 返回带v前缀的版本号，与GitHub API格式保持一致
+                value = (True, f"v{version_match.group(1)}" if version_match else None)
+        except Exception:
+            value = (False, None)
+
+        with self._probe_lock:
+            self._probe_cache['me3_full'] = (value, now + self.INSTALL_PROBE_TTL)
+        return value
+
+    def invalidate_install_cache(self):
+        """清除本地安装状态缓存（下载、安装、卸载后调用）"""
+        with self._probe_lock:
+            self._probe_cache.clear()
+        self._stat_cache.clear()
+
+    def is_me3_full_installed(self) -> bool:
+        """检查ME3完整安装版是否已安装"""
+        return self._probe_me3_full()[0]
 
     def find_me3_install_path(self) -> Optional[str]:
         """使用where命令定位ME3安装版的me3.exe位置"""
         try:
-            import subprocess
-            import sys
-
             # 使用系统环境变量执行where命令
             system_env = self._get_system_env()
             creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
@@ -466,8 +1104,6 @@ class DownloadManager(QObject):
     def find_uninstaller_path(self, me3_exe_path: str) -> Optional[str]:
         """根据me3.exe路径找到uninstall.exe（通常在../../uninstall.exe）"""
         try:
-            from pathlib import Path
-
             me3_path = Path(me3_exe_path)
             if not me3_path.exists():
                 return None
@@ -512,8 +1148,6 @@ class DownloadManager(QObject):
                 return False, "未找到卸载程序，请手动卸载"
 
             # 4. 执行静默卸载
-            import subprocess
-            import sys
 
             creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
             result = subprocess.run([uninstaller_path, '/S'],  # /S 参数用于静默卸载
@@ -522,10 +1156,10 @@ class DownloadManager(QObject):
 
             # 5. 验证卸载结果
             # 等待一段时间让卸载程序完成
-            import time
             time.sleep(2)
 
             # 检查是否还能检测到安装版
+            self.invalidate_install_cache()
             if not self.is_me3_full_installed():
                 return True, "ME3完整安装版卸载成功"
             else:
@@ -540,27 +1174,7 @@ class DownloadManager(QObject):
 
     def get_me3_full_version(self) -> Optional[str]:
         """获取ME3完整安装版版本"""
-        try:
-            import subprocess
-            import re
-            # 使用系统环境变量运行me3 -V命令获取版本
-            system_env = self._get_system_env()
-            import sys
-            creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            result = subprocess.run(['me3', '-V'],
-                                  capture_output=True, text=True, timeout=5,
-                                  env=system_env, creationflags=creation_flags)
-            if result.returncode == 0:
-                # 解析版本输出，支持 "me3 v0.8.1" 或 "0.8.1" 格式
-                output = result.stdout.strip()
-                version_match = re.search(r'v?(\d+\.\d+\.\d+)', output)
-                if version_match:
-                    # 返回带v前缀的版本号，与GitHub API格式保持一致
-                    return f"v{version_match.group(1)}"
-        except Exception as e:
-            print(f"获取ME3完整版版本失败: {e}")
-
-        return None
+        return self._probe_me3_full()[1]
 
     def get_me3_install_type(self) -> str:
         """获取ME3安装类型"""
@@ -620,14 +1234,15 @@ class DownloadManager(QObject):
 
     # ==================== EasyTier 相关方法 ====================
 
-    def get_latest_easytier_version(self, include_prerelease: bool = False) -> Optional[str]:
+    def get_latest_easytier_version(self, include_prerelease: bool = False, use_cache: bool = True) -> Optional[str]:
         """获取EasyTier最新版本
 
         Args:
             include_prerelease: 是否包含预发行版
+            use_cache: 是否使用未过期的发行版信息缓存
         """
         try:
-            release_info = self.get_easytier_release_info(include_prerelease)
+            release_info = self.get_easytier_release_info(include_prerelease, use_cache)
             if release_info:
                 return release_info.get('tag_name', '').lstrip('v')
             return None
@@ -635,57 +1250,40 @@ class DownloadManager(QObject):
             print(f"获取EasyTier版本失败: {e}")
             return None
 
-    def get_easytier_release_info(self, include_prerelease: bool = False) -> Optional[Dict]:
+    def get_easytier_release_info(self, include_prerelease: bool = False, use_cache: bool = True) -> Optional[Dict]:
         """获取EasyTier发行版详细信息
 
         Args:
             include_prerelease: 是否包含预发行版
+            use_cache: 是否使用未过期的发行版信息缓存
 
         Returns:
             包含版本信息的字典，包括tag_name, prerelease等字段
         """
-        cache_type = 'prerelease' if include_prerelease else 'release'
-
-        # 先检查缓存
-        cached_data = self._get_cached_data(cache_type)
-        if cached_data:
-            return cached_data
-
         try:
             if include_prerelease:
-                # 获取所有发行版，包括预发行版
-                url = "https://api.github.com/repos/EasyTier/EasyTier/releases"
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-
-                releases = response.json()
-                if releases:
-                    # 返回第一个发行版（最新的，可能是预发行版）
-                    data = releases[0]
-                    self._set_cache_data(cache_type, data)
-                    return data
-            else:
-                # 只获取正式发行版
-                url = "https://api.github.com/repos/EasyTier/EasyTier/releases/latest"
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-
-                data = response.json()
-                self._set_cache_data(cache_type, data)
-                return data
+                # 获取最新发行版，包括预发行版
+                releases = self._get_cached_release(self.EASYTIER_PRERELEASE_API, use_cache)
+                # 返回第一个发行版（最新的，可能是预发行版）
+                return releases[0] if releases else None
+            # 只获取正式发行版
+            return self._get_cached_release(self.EASYTIER_RELEASE_API, use_cache)
         except Exception as e:
             print(f"获取EasyTier发行版信息失败: {e}")
             return None
 
     def get_current_easytier_version(self) -> Optional[str]:
-        """获取当前安装的EasyTier版本"""
+        """获取当前安装的EasyTier版本（按文件修改时间缓存）"""
+        return self._get_stat_cached(
+            'easytier', self._version_sources['easytier'], self._read_current_easytier_version
+        )
+
+    def _read_current_easytier_version(self) -> Optional[str]:
+        """读取当前安装的EasyTier版本"""
         try:
-            import subprocess
-            import re
             # 执行EasyTier可执行文件获取真实版本
             easytier_exe_path = self.esr_dir / "easytier-core.exe"
             if easytier_exe_path.exists():
-                import sys
                 creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
                 result = subprocess.run([str(easytier_exe_path), '-V'],
                                       capture_output=True, text=True, timeout=5,
@@ -788,7 +1386,7 @@ class DownloadManager(QObject):
             return None
 
     def download_easytier(self, version: str = None, selected_mirror: str = None, include_prerelease: bool = False) -> bool:
-        """下载EasyTier
+        """下载EasyTier（版本信息获取和镜像选择在下载线程中进行）
 
         Args:
             version: 指定版本号，如果为None则获取最新版本
@@ -796,67 +1394,75 @@ class DownloadManager(QObject):
             include_prerelease: 是否包含预发行版（仅在version为None时生效）
         """
         try:
-            # 如果没有指定版本，获取最新版本
-            if not version:
-                version = self.get_latest_easytier_version(include_prerelease)
-                if not version:
-                    version_type = "预发行版" if include_prerelease else "正式版"
-                    print(f"无法获取EasyTier最新{version_type}")
-                    return False
-
-            download_url = self.get_easytier_download_url(version)
-            if not download_url:
-                return False
-
-            # 如果指定了镜像，优先使用指定的镜像
-            if selected_mirror:
-                self.easytier_mirrors_to_try = [selected_mirror] + [m for m in self.PROXY_URLS if m != selected_mirror] + [""]
-            else:
-                # 智能选择最佳下载源
-                best_source = self.get_best_download_source(download_url)
-                if best_source:
-                    self.easytier_mirrors_to_try = [best_source] + [m for m in self.PROXY_URLS if m != best_source] + [""]
-                else:
-                    self.easytier_mirrors_to_try = [""] + self.PROXY_URLS
-
-            # 保存下载参数
+            # 保存下载参数，下载地址在下载线程中确定
             self.easytier_download_params = {
                 'version': version,
                 'include_prerelease': include_prerelease,
-                'download_url': download_url
+                'download_url': None
             }
-
-            # 开始尝试第一个镜像
+            # 测速完成前的默认顺序，解析完成后替换
+            self.easytier_mirrors_to_try = [""] + self.get_mirrors_by_latency()
             self.easytier_current_mirror_index = 0
-            return self._try_next_easytier_mirror()
+
+            def resolve_url():
+                params = self.easytier_download_params
+                # 如果没有指定版本，获取最新版本
+                if not params['version']:
+                    params['version'] = self.get_latest_easytier_version(include_prerelease)
+                    if not params['version']:
+                        version_type = "预发行版" if include_prerelease else "正式版"
+                        print(f"无法获取EasyTier最新{version_type}")
+                        return None
+
+                download_url = self.get_easytier_download_url(params['version'])
+                if not download_url:
+                    return None
+                params['download_url'] = download_url
+
+                self.easytier_mirrors_to_try = self._order_download_sources(download_url, selected_mirror)
+                proxy = self.easytier_mirrors_to_try[0]
+                return f"{proxy}{download_url}" if proxy else download_url
+
+            return self._try_next_easytier_mirror(url_resolver=resolve_url)
 
         except Exception as e:
             print(f"下载EasyTier失败: {e}")
             return False
 
-    def _try_next_easytier_mirror(self) -> bool:
-        """尝试下一个EasyTier镜像"""
+    def _order_download_sources(self, download_url: str, selected_mirror: str = None) -> list:
+        """确定下载源尝试顺序（可能进行网络测速，应在下载线程中调用）"""
+        # 如果指定了镜像，优先使用指定的镜像
+        if selected_mirror:
+            return [selected_mirror] + [m for m in self.PROXY_URLS if m != selected_mirror] + [""]
+        # 智能选择最佳下载源
+        best_source = self.get_best_download_source(download_url)
+        if best_source:
+            return [best_source] + [m for m in self.PROXY_URLS if m != best_source] + [""]
+        return [""] + self.get_mirrors_by_latency()
+
+    def _try_next_easytier_mirror(self, url_resolver=None) -> bool:
+        """尝试下一个EasyTier镜像（url_resolver用于首次下载时在线程中确定地址）"""
         try:
             if self.easytier_current_mirror_index >= len(self.easytier_mirrors_to_try):
                 print("所有EasyTier下载源都失败")
-                if hasattr(self, 'easytier_install_finished'):
-                    self.easytier_install_finished.emit(False, "所有下载源都失败")
+                self.easytier_install_finished.emit(False, "所有下载源都失败")
                 return False
 
-            proxy = self.easytier_mirrors_to_try[self.easytier_current_mirror_index]
-            download_url = self.easytier_download_params['download_url']
-            version = self.easytier_download_params['version']
-
-            url = f"{proxy}{download_url}" if proxy else download_url
-            mirror_name = self._get_mirror_display_name(proxy)
-            print(f"尝试从 {mirror_name} 下载EasyTier...")
+            if url_resolver:
+                url = None
+                print("正在选择EasyTier下载源...")
+            else:
+                proxy = self.easytier_mirrors_to_try[self.easytier_current_mirror_index]
+                download_url = self.easytier_download_params['download_url']
+                url = f"{proxy}{download_url}" if proxy else download_url
+                mirror_name = self._get_mirror_display_name(proxy)
+                print(f"尝试从 {mirror_name} 下载EasyTier...")
 
             # 下载文件
-            filename = f"easytier-windows-x86_64-v{version}.zip"
-            save_path = self.esr_dir / filename
+            save_path = self.esr_dir / "easytier-windows-x86_64.zip"
 
             # 创建下载工作线程
-            self.easytier_download_worker = DownloadWorker(url, str(save_path))
+            self.easytier_download_worker = DownloadWorker(url, str(save_path), url_resolver=url_resolver)
             self.easytier_download_worker.finished.connect(
                 lambda success, msg: self._on_easytier_download_finished_with_retry(success, msg, save_path)
             )
@@ -869,7 +1475,7 @@ class DownloadManager(QObject):
             print(f"从 {mirror_name} 创建EasyTier下载任务失败: {e}")
             # 尝试下一个镜像
             self.easytier_current_mirror_index += 1
-            return self._try_next_easytier_mirror()
+            return self._try_next_easytier_mirror(url_resolver=url_resolver)
 
     def _on_easytier_download_finished_with_retry(self, success: bool, message: str, save_path: Path):
         """EasyTier下载完成回调（带重试逻辑）"""
@@ -881,76 +1487,99 @@ class DownloadManager(QObject):
             if self._extract_easytier(save_path, version):
                 print("EasyTier安装完成")
                 # 发送安装完成信号
-                if hasattr(self, 'easytier_install_finished'):
-                    self.easytier_install_finished.emit(True, "EasyTier安装完成")
+                self.easytier_install_finished.emit(True, "EasyTier安装完成")
             else:
                 print("EasyTier解压失败")
-                if hasattr(self, 'easytier_install_finished'):
-                    self.easytier_install_finished.emit(False, "EasyTier解压失败")
+                self.easytier_install_finished.emit(False, "EasyTier解压失败")
         else:
+            if not self.easytier_download_params['download_url']:
+                # 未能确定下载地址（无法获取版本信息），换镜像也无济于事
+                self.easytier_install_finished.emit(False, message)
+                return
+
             # 下载失败，尝试下一个镜像
-            mirror_name = self._get_mirror_display_name(self.easytier_mirrors_to_try[self.easytier_current_mirror_index])
+            failed_mirror = self.easytier_mirrors_to_try[self.easytier_current_mirror_index]
+            self.forget_download_source(self.easytier_download_params['download_url'], failed_mirror)
+            mirror_name = self._get_mirror_display_name(failed_mirror)
             print(f"从 {mirror_name} 下载EasyTier失败: {message}")
 
             # 尝试下一个镜像
             self.easytier_current_mirror_index += 1
             if not self._try_next_easytier_mirror():
                 # 所有镜像都失败了
-                if hasattr(self, 'easytier_install_finished'):
-                    self.easytier_install_finished.emit(False, f"所有下载源都失败，最后错误: {message}")
+                self.easytier_install_finished.emit(False, f"所有下载源都失败，最后错误: {message}")
 
     def _get_mirror_display_name(self, mirror_url: str) -> str:
         """获取镜像显示名称"""
-        if not mirror_url:
-            return "GitHub官方"
-        elif "gh-proxy.com" in mirror_url:
-            return "gh-proxy.com"
-        elif "ghproxy.net" in mirror_url:
-            return "ghproxy.net"
-        elif "ghfast.top" in mirror_url:
-            return "ghfast.top"
-        else:
-            return mirror_url.replace("https://", "").replace("http://", "").rstrip("/")
+        return mirror_display_name(mirror_url)
 
     def test_connectivity(self, url: str, timeout: int = 5) -> bool:
         """测试URL连通性"""
         try:
-            import requests
-            response = requests.head(url, timeout=timeout, allow_redirects=True)
+            response = get_http_session().head(url, timeout=timeout, allow_redirects=True)
             return response.status_code < 400
         except Exception as e:
             print(f"连通性测试失败 {url}: {e}")
             return False
 
+    # 同时参与测速的镜像数量
+    RACE_MIRROR_COUNT = 3
+    # 测速结果有效期（秒）
+    BEST_SOURCE_TTL = 300
+
     def get_best_download_source(self, github_url: str) -> str:
-        """获取最佳下载源（基于连通性测试）"""
-        try:
-            print("🔍 正在测试下载源连通性...")
+        """获取最佳下载源（GitHub官方与前几个镜像并行测试，取最先响应者）
 
-            # 首先测试GitHub官方
-            if self.test_connectivity("https://github.com", timeout=3):
-                print("✅ GitHub官方连接正常")
-                return ""  # 空字符串表示直接使用GitHub
-            else:
-                print("❌ GitHub官方连接失败，测试镜像站...")
+        同一主机的测速结果在有效期内直接复用，检查更新后预先测速的结果在点击下载时命中
+        """
+        host = urlsplit(github_url).netloc
+        cached = self._best_source_cache.get(host)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
 
-                # 测试镜像站连通性
-                for mirror in self.PROXY_URLS:
-                    mirror_name = self._get_mirror_display_name(mirror)
-                    test_url = f"{mirror}https://github.com"
+        candidates = [""] + self.get_mirrors_by_latency()[:self.RACE_MIRROR_COUNT]
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
 
-                    if self.test_connectivity(test_url, timeout=3):
-                        print(f"✅ {mirror_name} 连接正常")
-                        return mirror
-                    else:
-                        print(f"❌ {mirror_name} 连接失败")
+        timeout = 3
 
-                print("⚠️ 所有镜像站都无法连接，将使用GitHub官方（可能较慢）")
-                return ""  # 如果所有镜像都失败，还是尝试GitHub官方
+        def probe(proxy):
+            start = time.perf_counter()
+            ok = self.test_connectivity(f"{proxy}{github_url}" if proxy else github_url, timeout)
+            if proxy:
+                # 只有成功响应才计入实际耗时，失败按超时计入，降低下次的排序
+                latency_ms = (time.perf_counter() - start) * 1000 if ok else timeout * 1000
+                self.record_mirror_latency(proxy, latency_ms)
+            return ok
+
+        try:
+            print("🔍 正在测试下载源连通性...")
+
+            futures = {executor.submit(probe, proxy): proxy for proxy in candidates}
+            for future in as_completed(futures):
+                proxy = futures[future]
+                mirror_name = self._get_mirror_display_name(proxy)
+                if future.result():
+                    print(f"✅ {mirror_name} 响应最快")
+                    self._best_source_cache[host] = (proxy, time.monotonic() + self.BEST_SOURCE_TTL)
+                    return proxy  # 空字符串表示直接使用GitHub
+                print(f"❌ {mirror_name} 连接失败")
+
+            print("⚠️ 所有镜像站都无法连接，将使用GitHub官方（可能较慢）")
+            return ""  # 如果所有镜像都失败，还是尝试GitHub官方
 
         except Exception as e:
             print(f"连通性测试异常: {e}")
             return ""  # 异常时使用GitHub官方
+        finally:
+            # 不等待落后的测试，未开始的直接取消
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def forget_download_source(self, github_url: str, proxy: str):
+        """下载源实际下载失败时丢弃该主机的测速结果，下次重新测速而不是继续选中它"""
+        host = urlsplit(github_url).netloc
+        cached = self._best_source_cache.get(host)
+        if cached and cached[0] == proxy:
+            self._best_source_cache.pop(host, None)
 
     def _on_easytier_download_finished(self, success: bool, message: str, version: str, zip_path: Path, is_prerelease: bool = False):
         """EasyTier下载完成回调"""
@@ -960,23 +1589,17 @@ class DownloadManager(QObject):
                 self.save_easytier_version(version, is_prerelease)
                 print(f"EasyTier v{version} 安装完成")
                 # 发送安装完成信号
-                if hasattr(self, 'easytier_install_finished'):
-                    self.easytier_install_finished.emit(True, f"EasyTier v{version} 安装完成")
+                self.easytier_install_finished.emit(True, f"EasyTier v{version} 安装完成")
             else:
                 print("EasyTier解压失败")
-                if hasattr(self, 'easytier_install_finished'):
-                    self.easytier_install_finished.emit(False, "EasyTier解压失败")
+                self.easytier_install_finished.emit(False, "EasyTier解压失败")
         else:
             print(f"EasyTier下载失败: {message}")
-            if hasattr(self, 'easytier_install_finished'):
-                self.easytier_install_finished.emit(False, f"下载失败: {message}")
+            self.easytier_install_finished.emit(False, f"下载失败: {message}")
 
     def _extract_easytier(self, zip_path: Path, version: str) -> bool:
         """解压EasyTier"""
         try:
-            import zipfile
-            import shutil
-
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                 # 解压到ESR目录
                 zip_ref.extractall(self.esr_dir)
@@ -1034,43 +1657,44 @@ class DownloadManager(QObject):
         try:
             download_url = "https://github.com/QykXczj/test/releases/download/tests/OnlineFix.zip"
 
-            # 如果指定了镜像，优先使用指定的镜像
-            if selected_mirror:
-                self.onlinefix_mirrors_to_try = [selected_mirror] + [m for m in self.PROXY_URLS if m != selected_mirror] + [""]
-            else:
-                # 智能选择最佳下载源
-                best_source = self.get_best_download_source(download_url)
-                if best_source:
-                    self.onlinefix_mirrors_to_try = [best_source] + [m for m in self.PROXY_URLS if m != best_source] + [""]
-                else:
-                    self.onlinefix_mirrors_to_try = [""] + self.PROXY_URLS
+            # 测速完成前的默认顺序，选择下载源在下载线程中进行
+            self.onlinefix_mirrors_to_try = [""] + self.get_mirrors_by_latency()
+            self.onlinefix_current_mirror_index = 0
+
+            def resolve_url():
+                self.onlinefix_mirrors_to_try = self._order_download_sources(download_url, selected_mirror)
+                proxy = self.onlinefix_mirrors_to_try[0]
+                return f"{proxy}{download_url}" if proxy else download_url
 
             # 开始尝试第一个镜像
-            self.onlinefix_current_mirror_index = 0
-            return self._try_next_onlinefix_mirror(download_url)
+            return self._try_next_onlinefix_mirror(download_url, url_resolver=resolve_url)
 
         except Exception as e:
             print(f"下载OnlineFix失败: {e}")
             return False
 
-    def _try_next_onlinefix_mirror(self, download_url: str) -> bool:
-        """尝试下一个OnlineFix镜像"""
+    def _try_next_onlinefix_mirror(self, download_url: str, url_resolver=None) -> bool:
+        """尝试下一个OnlineFix镜像（url_resolver用于首次下载时在线程中选择下载源）"""
         try:
             if self.onlinefix_current_mirror_index >= len(self.onlinefix_mirrors_to_try):
                 print("所有OnlineFix下载源都失败")
                 self.onlinefix_download_finished.emit(False, "所有下载源都失败")
                 return False
 
-            proxy = self.onlinefix_mirrors_to_try[self.onlinefix_current_mirror_index]
-            url = f"{proxy}{download_url}" if proxy else download_url
-            mirror_name = self._get_mirror_display_name(proxy)
-            print(f"尝试从 {mirror_name} 下载OnlineFix...")
+            if url_resolver:
+                url = None
+                print("正在选择OnlineFix下载源...")
+            else:
+                proxy = self.onlinefix_mirrors_to_try[self.onlinefix_current_mirror_index]
+                url = f"{proxy}{download_url}" if proxy else download_url
+                mirror_name = self._get_mirror_display_name(proxy)
+                print(f"尝试从 {mirror_name} 下载OnlineFix...")
 
             # 下载文件
             save_path = self.onlinefix_dir / "OnlineFix.zip"
 
             # 创建下载工作线程
-            self.onlinefix_download_worker = DownloadWorker(url, str(save_path))
+            self.onlinefix_download_worker = DownloadWorker(url, str(save_path), url_resolver=url_resolver)
             self.onlinefix_download_worker.finished.connect(
                 lambda success, msg: self._on_onlinefix_download_finished_with_retry(success, msg, save_path, download_url)
             )
@@ -1085,7 +1709,7 @@ class DownloadManager(QObject):
             print(f"从 {mirror_name} 创建下载任务失败: {e}")
             # 尝试下一个镜像
             self.onlinefix_current_mirror_index += 1
-            return self._try_next_onlinefix_mirror(download_url)
+            return self._try_next_onlinefix_mirror(download_url, url_resolver=url_resolver)
 
     def _on_onlinefix_download_finished_with_retry(self, success: bool, message: str, zip_path: Path, download_url: str):
         """OnlineFix下载完成回调（带重试逻辑）"""
@@ -1100,7 +1724,9 @@ class DownloadManager(QObject):
                 self.onlinefix_download_finished.emit(False, "OnlineFix解压失败")
         else:
             # 下载失败，尝试下一个镜像
-            mirror_name = self._get_mirror_display_name(self.onlinefix_mirrors_to_try[self.onlinefix_current_mirror_index])
+            failed_mirror = self.onlinefix_mirrors_to_try[self.onlinefix_current_mirror_index]
+            self.forget_download_source(download_url, failed_mirror)
+            mirror_name = self._get_mirror_display_name(failed_mirror)
             print(f"从 {mirror_name} 下载OnlineFix失败: {message}")
 
             # 尝试下一个镜像
@@ -1127,9 +1753,6 @@ class DownloadManager(QObject):
     def extract_onlinefix(self, zip_path: Path) -> bool:
         """解压OnlineFix工具包"""
         try:
-            import zipfile
-            import time
-
             if not zip_path.exists():
                 print("❌ OnlineFix.zip文件不存在")
                 return False
@@ -1167,7 +1790,6 @@ class DownloadManager(QObject):
 
                     # 解压文件
                     with zip_ref.open(file_info) as source, open(target_path, 'wb') as target:
-                        import shutil
                         shutil.copyfileobj(source, target)
 
                     print(f"✅ 解压完成: {filename}")